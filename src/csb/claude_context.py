@@ -1,12 +1,222 @@
 """Claude Code context management - handles CLAUDE.md, skills, agents, commands discovery and sync."""
 
+import hashlib
 import json
+import os
 import shutil
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-
-
-@dataclass
+from typing import Literal
+
+# FICLONE ioctl - creates a CoW reflink on filesystems that support it
+# (btrfs, XFS). Zero data movement, unlike a byte copy.
+_FICLONE = 0x40049409
+
+# Resolved once: Path.home() does an env/passwd lookup on every call
+_HOME = Path.home()
+
+# Static head/tail of the container setup script; only the per-parent
+# symlink lines in between vary per project.
+_SETUP_HEAD = """\
+#!/bin/bash
+# Auto-generated by csb - sets up Claude context in container
+set -e
+
+CLAUDE_HOME="/home/claude/.claude"
+CONTEXT_DIR="/workspace/.devcontainer/claude-context"
+
+# Ensure directories exist
+mkdir -p "$CLAUDE_HOME/rules"
+mkdir -p "$CLAUDE_HOME/skills"
+mkdir -p "$CLAUDE_HOME/agents"
+mkdir -p "$CLAUDE_HOME/commands"
+
+"""
+
+_SETUP_TAIL = """\
+# Symlink parent skills, agents, commands into Claude's directories
+for level_dir in "$CONTEXT_DIR/parents/level-"*; do
+    if [ -d "$level_dir" ]; then
+        level_name=$(basename "$level_dir")
+
+        # Symlink skills
+        if [ -d "$level_dir/skills" ]; then
+            for skill in "$level_dir/skills/"*; do
+                [ -d "$skill" ] && ln -sf "$skill" "$CLAUDE_HOME/skills/$(basename $skill)-$level_name"
+            done
+        fi
+
+        # Symlink agents
+        if [ -d "$level_dir/agents" ]; then
+            for agent in "$level_dir/agents/"*.md; do
+                [ -f "$agent" ] && ln -sf "$agent" "$CLAUDE_HOME/agents/$(basename $agent .md)-$level_name.md"
+            done
+        fi
+
+        # Symlink commands
+        if [ -d "$level_dir/commands" ]; then
+            for cmd in "$level_dir/commands/"*.md; do
+                [ -f "$cmd" ] && ln -sf "$cmd" "$CLAUDE_HOME/commands/$(basename $cmd .md)-$level_name.md"
+            done
+        fi
+
+        # Symlink rules
+        if [ -d "$level_dir/rules" ]; then
+            for rule in "$level_dir/rules/"*.md; do
+                [ -f "$rule" ] && ln -sf "$rule" "$CLAUDE_HOME/rules/$(basename $rule .md)-$level_name.md"
+            done
+        fi
+    fi
+done
+
+echo 'Claude context setup complete!'"""
+
+
+def _mtime_ns(path: Path | str) -> int | None:
+    """Return st_mtime_ns for path, or None if it can't be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _source_stamp(path: str) -> int | None:
+    """Fingerprint a copy source: mtime_ns, maximized over a directory's
+    subtree.
+
+    A directory's own mtime only moves when a direct child appears or
+    disappears, so a file added under a nested subdirectory (e.g. inside
+    a skill) would never invalidate the copy on its own. The walk is
+    scandir + stat only - no file reads - and file edits count too,
+    since they bump the file's own mtime.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    newest = st.st_mtime_ns
+    if not stat.S_ISDIR(st.st_mode):
+        return newest
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        entry_mtime = entry.stat(
+                            follow_symlinks=False
+                        ).st_mtime_ns
+                    except OSError:
+                        continue
+                    if entry_mtime > newest:
+                        newest = entry_mtime
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return newest
+
+
+def _atomic_write(target: Path, payload: str, mode: int | None = None) -> None:
+    """Write payload to target atomically via a temp file and rename.
+
+    Readers never see a partially written file, and setting the mode on the
+    open fd folds the chmod into the same pass.
+    """
+    fd, tmp = tempfile.mkstemp(dir=str(target.parent), prefix=".tmp-")
+    try:
+        try:
+            os.write(fd, payload.encode())
+            if mode is not None:
+                os.fchmod(fd, mode)
+        finally:
+            os.close(fd)
+    except OSError:
+        os.unlink(tmp)
+        raise
+    os.replace(tmp, target)
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Clone src to dst via the FICLONE ioctl (raises OSError if unsupported)."""
+    import fcntl
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        except OSError:
+            os.close(dst_fd)
+            os.unlink(dst)
+            raise
+        os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _copy_file(src: str, dst: str, mode: str) -> None:
+    """Copy one file, preferring metadata-only operations over byte copies.
+
+    "hardlink" links src to dst (O(1), zero data movement); "reflink"
+    creates a CoW clone where the filesystem supports it. Both fall back
+    to a plain byte copy on OSError (cross-device, EPERM, unsupported fs).
+    """
+    if mode == "hardlink":
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    elif mode == "reflink":
+        try:
+            _reflink(src, dst)
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _fast_copytree(
+    src: Path | str,
+    dst: Path | str,
+    mode: Literal["hardlink", "reflink", "copy"] = "hardlink",
+) -> None:
+    """Recursively copy a directory tree using a single scandir per level.
+
+    Unlike shutil.copytree, the file/dir decision comes straight from the
+    DirEntry (no extra stat per entry), and file contents are shared via
+    hardlink/reflink where possible instead of being byte-copied.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            dst_entry = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _fast_copytree(entry.path, dst_entry, mode)
+            else:
+                _copy_file(entry.path, dst_entry, mode)
+
+
+def _entries(path: Path) -> dict[str, os.DirEntry]:
+    """Read a directory once and return its entries by name.
+
+    A single scandir replaces the per-component exists()/is_dir() probes;
+    DirEntry type checks reuse the dirent info without extra stat calls.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return {}
+
+
+@dataclass(slots=True)
 class DiscoveredContext:
     """Represents discovered Claude context from a location."""
 
@@ -18,6 +228,9 @@ class DiscoveredContext:
     skills_dir: Path | None = None
     agents_dir: Path | None = None
     commands_dir: Path | None = None
+    _dict_cache: dict | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def has_content(self) -> bool:
         """Check if any Claude content was found."""
@@ -32,20 +245,32 @@ class DiscoveredContext:
             ]
         )
 
+    # (key, attribute) pairs driving to_dict - all stringified Path|None
+    _PATH_FIELDS = (
+        "claude_md",
+        "claude_local_md",
+        "rules_dir",
+        "skills_dir",
+        "agents_dir",
+        "commands_dir",
+    )
+
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "source_path": str(self.source_path),
-            "relative_depth": self.relative_depth,
-            "claude_md": str(self.claude_md) if self.claude_md else None,
-            "claude_local_md": str(self.claude_local_md)
-            if self.claude_local_md
-            else None,
-            "rules_dir": str(self.rules_dir) if self.rules_dir else None,
-            "skills_dir": str(self.skills_dir) if self.skills_dir else None,
-            "agents_dir": str(self.agents_dir) if self.agents_dir else None,
-            "commands_dir": str(self.commands_dir) if self.commands_dir else None,
-        }
+        """Convert to dictionary for JSON serialization.
+
+        The result is cached - list_contexts serializes every discovered
+        context and may be called repeatedly in one process.
+        """
+        if self._dict_cache is None:
+            result = {
+                "source_path": str(self.source_path),
+                "relative_depth": self.relative_depth,
+            }
+            for name in self._PATH_FIELDS:
+                value = getattr(self, name)
+                result[name] = None if value is None else str(value)
+            self._dict_cache = result
+        return self._dict_cache
 
 
 @dataclass
@@ -107,65 +332,105 @@ class ClaudeContext:
 
     CONTEXT_DIR_NAME = "claude-context"
     SETUP_SCRIPT_NAME = "setup-claude-context.sh"
+    MANIFEST_NAME = ".manifest.json"
+
+    _MISSING = object()  # sentinel: global context not yet discovered
 
     def __init__(self, project_path: Path):
         self.project_path = project_path
         self.devcontainer_path = project_path / ".devcontainer"
         self.context_path = self.devcontainer_path / self.CONTEXT_DIR_NAME
+        self._parent_cache: dict[int, list[DiscoveredContext]] = {}
+        self._global_cache = self._MISSING
+
+    def invalidate_cache(self) -> None:
+        """Drop memoized discovery results to force a fresh filesystem scan."""
+        self._parent_cache.clear()
+        self._global_cache = self._MISSING
 
     def discover_parent_contexts(self, max_depth: int = 3) -> list[DiscoveredContext]:
         """Discover Claude context in parent directories.
 
+        Results are memoized per instance so repeated calls (e.g. from
+        `list_contexts` followed by `sync`) don't re-walk the same ancestors.
+
         Args:
             max_depth: Maximum number of parent levels to traverse
 
         Returns:
             List of DiscoveredContext objects, ordered by depth (closest first)
         """
-        contexts = []
-        current = self.project_path.parent
-        depth = 1
-        home_dir = Path.home()
-
-        while depth <= max_depth and current != current.parent:
-            # Skip home directory - its .claude/ is already mounted as global context
-            if current == home_dir:
-                current = current.parent
-                depth += 1
-                continue
+        cached = self._parent_cache.get(max_depth)
+        if cached is not None:
+            return cached
+
+        # Build the ancestor list first (cheap pointer walk), then scan
+        # concurrently - the scans are syscall-bound and release the GIL.
+        tasks = self._ancestor_dirs(max_depth)
+
+        if len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                scanned = list(
+                    executor.map(lambda task: self._scan_directory(*task), tasks)
+                )
+        else:
+            scanned = [self._scan_directory(path, depth) for path, depth in tasks]
 
-            context = self._scan_directory(current, depth)
-            if context.has_content():
-                contexts.append(context)
-            current = current.parent
-            depth += 1
+        # executor.map preserves input order, so closest-first is kept
+        contexts = [context for context in scanned if context.has_content()]
 
+        self._parent_cache[max_depth] = contexts
         return contexts
 
+    def _ancestor_dirs(self, max_depth: int) -> list[tuple[Path, int]]:
+        """List the ancestor directories discovery would scan, with depths."""
+        return [
+            (current, depth)
+            for depth, current in enumerate(
+                self.project_path.parents[:max_depth], start=1
+            )
+            # Skip home directory - its .claude/ is already mounted as
+            # global context - and the filesystem root.
+            if current != _HOME and current != current.parent
+        ]
+
     def discover_global_context(self) -> DiscoveredContext | None:
-        """Discover Claude context in ~/.claude/."""
-        claude_home = Path.home() / ".claude"
-        if not claude_home.exists():
+        """Discover Claude context in ~/.claude/.
+
+        The result is memoized per instance; call `invalidate_cache()` to
+        force a rescan.
+        """
+        if self._global_cache is not self._MISSING:
+            return self._global_cache
+
+        claude_home = _HOME / ".claude"
+
+        # One scandir covers both the existence probe and the component
+        # checks; a missing ~/.claude simply yields no entries.
+        entries = _entries(claude_home)
+        if not entries:
+            self._global_cache = None
             return None
 
         context = DiscoveredContext(
             source_path=claude_home,
             relative_depth=-1,  # -1 indicates global
         )
-
-        # Check for each component
-        if (claude_home / "CLAUDE.md").exists():
+        claude_md = entries.get("CLAUDE.md")
+        if claude_md and claude_md.is_file():
             context.claude_md = claude_home / "CLAUDE.md"
-        if (claude_home / "rules").is_dir():
-            context.rules_dir = claude_home / "rules"
-        if (claude_home / "skills").is_dir():
-            context.skills_dir = claude_home / "skills"
-        if (claude_home / "agents").is_dir():
-            context.agents_dir = claude_home / "agents"
-        if (claude_home / "commands").is_dir():
-            context.commands_dir = claude_home / "commands"
-
-        return context if context.has_content() else None
+        for dir_name, attr in (
+            ("rules", "rules_dir"),
+            ("skills", "skills_dir"),
+            ("agents", "agents_dir"),
+            ("commands", "commands_dir"),
+        ):
+            entry = entries.get(dir_name)
+            if entry and entry.is_dir():
+                setattr(context, attr, claude_home / dir_name)
+
+        self._global_cache = context if context.has_content() else None
+        return self._global_cache
 
     def _scan_directory(self, path: Path, depth: int) -> DiscoveredContext:
         """Scan a directory for Claude context files."""
@@ -179,29 +444,37 @@ class ClaudeContext:
 
         context = DiscoveredContext(source_path=path, relative_depth=depth)
 
-        # Check for CLAUDE.md in root
-        if (path / "CLAUDE.md").exists():
+        # One directory read covers CLAUDE.md, CLAUDE.local.md and .claude/
+        entries = _entries(path)
+
+        claude_md = entries.get("CLAUDE.md")
+        if claude_md and claude_md.is_file():
             context.claude_md = path / "CLAUDE.md"
 
-        # Check for CLAUDE.local.md
-        if (path / "CLAUDE.local.md").exists():
+        claude_local_md = entries.get("CLAUDE.local.md")
+        if claude_local_md and claude_local_md.is_file():
             context.claude_local_md = path / "CLAUDE.local.md"
 
         # Check for .claude/ directory contents
-        claude_dir = path / ".claude"
-        if claude_dir.is_dir():
+        claude_entry = entries.get(".claude")
+        if claude_entry and claude_entry.is_dir(follow_symlinks=False):
+            claude_dir = path / ".claude"
+            claude_entries = _entries(claude_dir)
+
             # Also check for CLAUDE.md inside .claude/
-            if (claude_dir / "CLAUDE.md").exists():
+            inner_md = claude_entries.get("CLAUDE.md")
+            if inner_md and inner_md.is_file():
                 context.claude_md = claude_dir / "CLAUDE.md"
 
-            if (claude_dir / "rules").is_dir():
-                context.rules_dir = claude_dir / "rules"
-            if (claude_dir / "skills").is_dir():
-                context.skills_dir = claude_dir / "skills"
-            if (claude_dir / "agents").is_dir():
-                context.agents_dir = claude_dir / "agents"
-            if (claude_dir / "commands").is_dir():
-                context.commands_dir = claude_dir / "commands"
+            for dir_name, attr in (
+                ("rules", "rules_dir"),
+                ("skills", "skills_dir"),
+                ("agents", "agents_dir"),
+                ("commands", "commands_dir"),
+            ):
+                entry = claude_entries.get(dir_name)
+                if entry and entry.is_dir():
+                    setattr(context, attr, claude_dir / dir_name)
 
         return context
 
@@ -209,26 +482,38 @@ class ClaudeContext:
         self,
         contexts: list[DiscoveredContext],
         config: ClaudeContextConfig,
+        mode: Literal["hardlink", "reflink", "copy"] = "hardlink",
+        scan_roots: dict | None = None,
     ) -> dict:
         """Copy discovered contexts to .devcontainer/claude-context/.
 
         Args:
             contexts: List of discovered contexts to copy
             config: Configuration specifying what to include
+            mode: How to materialize files - hardlink (default) and reflink
+                avoid byte copies where the filesystem allows, falling back
+                to a plain copy otherwise
+            scan_roots: Fingerprints of the directories discovery scanned,
+                recorded in the manifest so sync() can validate a warm run
+                without re-walking
 
         Returns:
             Dictionary mapping target paths to source paths (for csb.json)
         """
-        # Clean and recreate context directory
-        if self.context_path.exists():
-            shutil.rmtree(self.context_path)
-        self.context_path.mkdir(parents=True)
+        # Load the manifest from the previous sync so unchanged sources can
+        # be kept in place instead of rm-tree'ing and recopying everything.
+        manifest = self._load_manifest().get("copies", {})
+        new_manifest = {}
+
+        self.context_path.mkdir(parents=True, exist_ok=True)
 
         copied_sources = {}
 
-        # Create subdirectories for organization
-        parents_dir = self.context_path / "parents"
-        parents_dir.mkdir()
+        # Hot loop works on raw strings: os.path.join/relpath are
+        # C-implemented and avoid a transient PurePath per destination.
+        dc_str = os.fspath(self.devcontainer_path)
+        parents_str = os.path.join(os.fspath(self.context_path), "parents")
+        os.makedirs(parents_str, exist_ok=True)
 
         for context in contexts:
             if context.relative_depth == -1:
@@ -236,24 +521,26 @@ class ClaudeContext:
                 continue
 
             # Create directory for this parent level
-            parent_dir = parents_dir / f"level-{context.relative_depth}"
-            parent_dir.mkdir(exist_ok=True)
-
-            # Copy CLAUDE.md
-            if context.claude_md:
-                dest = parent_dir / "CLAUDE.md"
-                shutil.copy2(context.claude_md, dest)
-                copied_sources[str(dest.relative_to(self.devcontainer_path))] = str(
-                    context.claude_md
-                )
+            parent_dir = os.path.join(parents_str, f"level-{context.relative_depth}")
+            os.makedirs(parent_dir, exist_ok=True)
 
-            # Copy CLAUDE.local.md (if exists and user wants it)
-            if context.claude_local_md:
-                dest = parent_dir / "CLAUDE.local.md"
-                shutil.copy2(context.claude_local_md, dest)
-                copied_sources[str(dest.relative_to(self.devcontainer_path))] = str(
-                    context.claude_local_md
-                )
+            # Copy CLAUDE.md / CLAUDE.local.md
+            for file_name, source_file in [
+                ("CLAUDE.md", context.claude_md),
+                ("CLAUDE.local.md", context.claude_local_md),
+            ]:
+                if not source_file:
+                    continue
+                src = os.fspath(source_file)
+                dest = os.path.join(parent_dir, file_name)
+                rel_dest = os.path.relpath(dest, dc_str)
+                mtime_ns = os.stat(src).st_mtime_ns
+                if not self._is_copy_current(manifest, rel_dest, src, mtime_ns, dest):
+                    if os.path.exists(dest):
+                        os.unlink(dest)
+                    _copy_file(src, dest, mode)
+                new_manifest[rel_dest] = {"src": src, "mtime_ns": mtime_ns}
+                copied_sources[rel_dest] = src
 
             # Copy directories
             for dir_name, source_dir in [
@@ -263,17 +550,111 @@ class ClaudeContext:
                 ("commands", context.commands_dir),
             ]:
                 if source_dir and source_dir.is_dir():
-                    dest_dir = parent_dir / dir_name
-                    shutil.copytree(source_dir, dest_dir)
-                    copied_sources[
-                        str(dest_dir.relative_to(self.devcontainer_path))
-                    ] = str(source_dir)
+                    src = os.fspath(source_dir)
+                    dest_dir = os.path.join(parent_dir, dir_name)
+                    rel_dest = os.path.relpath(dest_dir, dc_str)
+                    # Subtree stamp, not the top dir's mtime - nested
+                    # additions must invalidate the copy
+                    mtime_ns = _source_stamp(src)
+                    if not self._is_copy_current(
+                        manifest, rel_dest, src, mtime_ns, dest_dir
+                    ):
+                        if os.path.exists(dest_dir):
+                            shutil.rmtree(dest_dir)
+                        _fast_copytree(src, dest_dir, mode)
+                    new_manifest[rel_dest] = {"src": src, "mtime_ns": mtime_ns}
+                    copied_sources[rel_dest] = src
+
+        # Remove targets whose source disappeared since the last sync
+        for rel_dest in manifest.keys() - new_manifest.keys():
+            stale = os.path.join(dc_str, rel_dest)
+            if os.path.isdir(stale):
+                shutil.rmtree(stale)
+            elif os.path.exists(stale):
+                os.unlink(stale)
+
+        (self.context_path / self.MANIFEST_NAME).write_text(
+            json.dumps({"roots": scan_roots or {}, "copies": new_manifest}, indent=2)
+        )
 
         # Generate setup script for container
         self._generate_setup_script(contexts, config)
 
         return copied_sources
 
+    def _load_manifest(self) -> dict:
+        """Load the copy manifest from the previous sync, if any."""
+        manifest_path = self.context_path / self.MANIFEST_NAME
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _scan_roots(self, config: ClaudeContextConfig) -> dict:
+        """Fingerprint every directory a sync would scan (mtime_ns or None)."""
+        roots = {}
+        if config.auto_discover_parents:
+            for path, _depth in self._ancestor_dirs(config.parent_max_depth):
+                roots[str(path)] = _mtime_ns(path)
+        for extra_path in config.extra_paths:
+            path = Path(extra_path).expanduser()
+            roots[str(path)] = _mtime_ns(path)
+        return roots
+
+    def sources_fingerprint(self, config: ClaudeContextConfig) -> str:
+        """Digest of everything the next sync would read.
+
+        Covers the scanned roots and the current stamp of every source
+        recorded in the manifest - the same inputs the warm-scan early
+        exit in `sync` checks, at the cost of a stat pass per source.
+        Callers can persist this after a sync and skip re-syncing while
+        it is unchanged.
+        """
+        roots = self._scan_roots(config)
+        copies = self._load_manifest().get("copies") or {}
+        sources = sorted(
+            {
+                entry["src"]
+                for entry in copies.values()
+                if isinstance(entry, dict) and "src" in entry
+            }
+        )
+        payload = json.dumps(
+            [sorted(roots.items()), [(src, _source_stamp(src)) for src in sources]]
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def _copies_current(self, copies: dict) -> bool:
+        """Check every recorded copy against its source's current stamp."""
+        dc_str = os.fspath(self.devcontainer_path)
+        for rel_dest, entry in copies.items():
+            if not isinstance(entry, dict):
+                return False
+            src = entry.get("src")
+            if src is None or _source_stamp(src) != entry.get("mtime_ns"):
+                return False
+            if not os.path.exists(os.path.join(dc_str, rel_dest)):
+                return False
+        return True
+
+    @staticmethod
+    def _is_copy_current(
+        manifest: dict,
+        rel_dest: str,
+        source: str,
+        mtime_ns: int,
+        dest: str,
+    ) -> bool:
+        """Check whether an existing copy is still up to date with its source."""
+        entry = manifest.get(rel_dest)
+        return (
+            isinstance(entry, dict)
+            and entry.get("src") == source
+            and entry.get("mtime_ns") == mtime_ns
+            and os.path.exists(dest)
+        )
+
     def _generate_setup_script(
         self,
         contexts: list[DiscoveredContext],
@@ -282,88 +663,30 @@ class ClaudeContext:
         """Generate shell script to set up Claude context in container."""
         script_path = self.context_path / self.SETUP_SCRIPT_NAME
 
-        lines = [
-            "#!/bin/bash",
-            "# Auto-generated by csb - sets up Claude context in container",
-            "set -e",
-            "",
-            'CLAUDE_HOME="/home/claude/.claude"',
-            'CONTEXT_DIR="/workspace/.devcontainer/claude-context"',
-            "",
-            "# Ensure directories exist",
-            'mkdir -p "$CLAUDE_HOME/rules"',
-            'mkdir -p "$CLAUDE_HOME/skills"',
-            'mkdir -p "$CLAUDE_HOME/agents"',
-            'mkdir -p "$CLAUDE_HOME/commands"',
-            "",
+        # Only the parent CLAUDE.md imports vary; head and tail are static
+        parent_claude_mds = [
+            f"level-{context.relative_depth}/CLAUDE.md"
+            for context in contexts
+            if context.relative_depth > 0 and context.claude_md
         ]
 
-        # Copy parent CLAUDE.md files and create imports
-        parent_claude_mds = []
-        for context in contexts:
-            if context.relative_depth > 0 and context.claude_md:
-                parent_claude_mds.append(f"level-{context.relative_depth}/CLAUDE.md")
-
+        imports = ""
         if parent_claude_mds:
-            lines.extend(
-                [
-                    "# Create parent context imports in a way Claude can find them",
-                    "# We create a .claude/parents/ directory with symlinks",
-                    'mkdir -p "$CLAUDE_HOME/parents"',
-                    "",
-                ]
+            links = "\n".join(
+                f'ln -sf "$CONTEXT_DIR/parents/{md_path}"'
+                f' "$CLAUDE_HOME/parents/{md_path.split("/", 1)[0]}-CLAUDE.md"'
+                for md_path in parent_claude_mds
+            )
+            imports = (
+                "# Create parent context imports in a way Claude can find them\n"
+                "# We create a .claude/parents/ directory with symlinks\n"
+                'mkdir -p "$CLAUDE_HOME/parents"\n'
+                "\n"
+                f"{links}\n"
+                "\n"
             )
-            for md_path in parent_claude_mds:
-                level = md_path.split("/")[0]
-                lines.append(
-                    f'ln -sf "$CONTEXT_DIR/parents/{md_path}" "$CLAUDE_HOME/parents/{level}-CLAUDE.md"'
-                )
-            lines.append("")
-
-        # Symlink parent skills, agents, commands into global directories
-        lines.extend(
-            [
-                "# Symlink parent skills, agents, commands into Claude's directories",
-                'for level_dir in "$CONTEXT_DIR/parents/level-"*; do',
-                '    if [ -d "$level_dir" ]; then',
-                '        level_name=$(basename "$level_dir")',
-                "        ",
-                "        # Symlink skills",
-                '        if [ -d "$level_dir/skills" ]; then',
-                '            for skill in "$level_dir/skills/"*; do',
-                '                [ -d "$skill" ] && ln -sf "$skill" "$CLAUDE_HOME/skills/$(basename $skill)-$level_name"',
-                "            done",
-                "        fi",
-                "        ",
-                "        # Symlink agents",
-                '        if [ -d "$level_dir/agents" ]; then',
-                '            for agent in "$level_dir/agents/"*.md; do',
-                '                [ -f "$agent" ] && ln -sf "$agent" "$CLAUDE_HOME/agents/$(basename $agent .md)-$level_name.md"',
-                "            done",
-                "        fi",
-                "        ",
-                "        # Symlink commands",
-                '        if [ -d "$level_dir/commands" ]; then',
-                '            for cmd in "$level_dir/commands/"*.md; do',
-                '                [ -f "$cmd" ] && ln -sf "$cmd" "$CLAUDE_HOME/commands/$(basename $cmd .md)-$level_name.md"',
-                "            done",
-                "        fi",
-                "        ",
-                "        # Symlink rules",
-                '        if [ -d "$level_dir/rules" ]; then',
-                '            for rule in "$level_dir/rules/"*.md; do',
-                '                [ -f "$rule" ] && ln -sf "$rule" "$CLAUDE_HOME/rules/$(basename $rule .md)-$level_name.md"',
-                "            done",
-                "        fi",
-                "    fi",
-                "done",
-                "",
-                "echo 'Claude context setup complete!'",
-            ]
-        )
 
-        script_path.write_text("\n".join(lines))
-        script_path.chmod(0o755)
+        _atomic_write(script_path, _SETUP_HEAD + imports + _SETUP_TAIL, mode=0o755)
 
     def sync(self, config: ClaudeContextConfig) -> dict:
         """Re-sync contexts from their sources.
@@ -371,6 +694,15 @@ class ClaudeContext:
         Returns:
             Dictionary of what was synced
         """
+        # Warm-scan early exit: if every scanned root and every recorded
+        # source is unchanged since the last sync, the previous result
+        # still holds - O(#sources) stats, no discovery walk or copying.
+        roots = self._scan_roots(config)
+        manifest = self._load_manifest()
+        copies = manifest.get("copies")
+        if copies and manifest.get("roots") == roots and self._copies_current(copies):
+            return {rel: entry["src"] for rel, entry in copies.items()}
+
         contexts = []
 
         if config.auto_discover_parents:
@@ -385,7 +717,7 @@ class ClaudeContext:
                 if context.has_content():
                     contexts.append(context)
 
-        return self.copy_contexts(contexts, config)
+        return self.copy_contexts(contexts, config, scan_roots=roots)
 
     def list_contexts(self, config: ClaudeContextConfig) -> dict:
         """List all Claude contexts that would be included.
@@ -415,7 +747,8 @@ class ClaudeContext:
         if self.context_path.exists():
             csb_json = self.devcontainer_path / "csb.json"
             if csb_json.exists():
-                csb_config = json.loads(csb_json.read_text())
+                with csb_json.open("rb") as f:
+                    csb_config = json.load(f)
                 result["copied"] = csb_config.get("claude_context_sources", {})
 
         return result
@@ -429,15 +762,25 @@ class ClaudeContext:
         Returns:
             True if successful
         """
-        import subprocess
-
         script_path = (
             f"/workspace/.devcontainer/{self.CONTEXT_DIR_NAME}/{self.SETUP_SCRIPT_NAME}"
         )
+        cmd = ["bash", script_path]
+
+        # Talk to the daemon directly when its socket is reachable - this
+        # avoids forking the docker CLI for what is one HTTP round-trip.
+        from csb.docker_api import exec_in_container
+
+        try:
+            return exec_in_container(container_id, cmd, timeout=30)
+        except OSError:
+            pass
+
+        import subprocess
 
         try:
             result = subprocess.run(
-                ["docker", "exec", container_id, "bash", script_path],
+                ["docker", "exec", container_id] + cmd,
                 capture_output=True,
                 text=True,
                 timeout=30,
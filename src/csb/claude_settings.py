@@ -3,57 +3,73 @@
 from __future__ import annotations
 
 import copy
+import functools
 import json
+import os
 import shlex
+import tempfile
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=512)
 def _wrap_absolute_command(command: str) -> str:
     """Wrap absolute-path commands so missing binaries don't raise errors."""
     stripped = command.strip()
     if not stripped.startswith("/"):
         return command
 
-    try:
-        parts = shlex.split(stripped)
-    except ValueError:
-        return command
+    # Fast path: no quoting or escaping, so the binary is simply everything
+    # up to the first whitespace - a C-level split instead of shlex's
+    # pure-Python tokenizer. split(None) stops at any whitespace,
+    # including the newlines shlex also treats as separators.
+    if '"' not in stripped and "'" not in stripped and "\\" not in stripped:
+        binary = stripped.split(None, 1)[0]
+    else:
+        try:
+            parts = shlex.split(stripped)
+        except ValueError:
+            return command
 
-    if not parts:
-        return command
+        if not parts:
+            return command
 
-    binary = parts[0]
-    if not binary.startswith("/"):
-        return command
+        binary = parts[0]
+        if not binary.startswith("/"):
+            return command
 
     return f'test -x "{binary}" || exit 0; {command}'
 
 
-def sanitize_settings(settings: dict) -> dict:
-    """Return a sanitized copy of settings for container use."""
-    settings = copy.deepcopy(settings)
-    hooks = settings.get("hooks")
-    if not isinstance(hooks, dict):
-        return settings
+def _iter_command_hooks(settings: dict):
+    """Yield every command-type hook dict in settings, in one flat pass.
 
+    Uses `type(x) is ...` identity checks - JSON never produces dict/list
+    subclasses, and the C-level check is cheaper than isinstance.
+    """
+    hooks = settings.get("hooks")
+    if type(hooks) is not dict:
+        return
     for hook_group in hooks.values():
-        if not isinstance(hook_group, list):
+        if type(hook_group) is not list:
             continue
         for entry in hook_group:
-            if not isinstance(entry, dict):
+            if type(entry) is not dict:
                 continue
             hook_list = entry.get("hooks")
-            if not isinstance(hook_list, list):
+            if type(hook_list) is not list:
                 continue
             for hook in hook_list:
-                if not isinstance(hook, dict):
-                    continue
-                if hook.get("type") != "command":
-                    continue
-                command = hook.get("command")
-                if isinstance(command, str):
-                    hook["command"] = _wrap_absolute_command(command)
+                if type(hook) is dict and hook.get("type") == "command":
+                    yield hook
 
+
+def sanitize_settings(settings: dict) -> dict:
+    """Return a sanitized copy of settings for container use."""
+    settings = copy.deepcopy(settings)
+    for hook in _iter_command_hooks(settings):
+        command = hook.get("command")
+        if type(command) is str:
+            hook["command"] = _wrap_absolute_command(command)
     return settings
 
 
@@ -64,13 +80,36 @@ def generate_runtime_settings(
     if source_path is None:
         source_path = Path.home() / ".claude" / "settings.json"
 
-    settings = {}
-    if source_path.exists():
-        try:
-            settings = json.loads(source_path.read_text())
-        except json.JSONDecodeError:
-            settings = {}
+    # Open directly instead of exists()+open: one syscall, and race-free
+    # against the file disappearing between the check and the read.
+    try:
+        # json.load on a binary handle lets the C parser consume the
+        # bytes directly, skipping the intermediate str from read_text()
+        with source_path.open("rb") as f:
+            settings = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        settings = {}
 
     sanitized = sanitize_settings(settings)
-    output_path.write_text(json.dumps(sanitized, indent=2))
+
+    # Write via temp file + rename so the mounted settings.json is never
+    # observed half-written by a running container.
+    # Compact separators and ensure_ascii=False: the file is only ever
+    # read by Claude in the container, so skip pretty-printing and the
+    # per-character ASCII escape scan.
+    payload = json.dumps(sanitized, ensure_ascii=False, separators=(",", ":"))
+    fd, tmp = tempfile.mkstemp(dir=str(output_path.parent), prefix=".tmp-")
+    try:
+        try:
+            os.write(fd, payload.encode())
+            # mkstemp creates the file 0600, but the container's claude
+            # user reads it through the bind mount - restore the
+            # umask-default mode the plain write used to produce
+            os.fchmod(fd, 0o644)
+        finally:
+            os.close(fd)
+    except OSError:
+        os.unlink(tmp)
+        raise
+    os.replace(tmp, output_path)
     return sanitized
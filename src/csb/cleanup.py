@@ -9,13 +9,23 @@ This module provides utilities for:
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import re
 import shutil
 import subprocess
+import time
+import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+from csb.docker_api import api_json, api_request
+
 
 @dataclass
 class ContainerInfo:
@@ -92,7 +102,10 @@ class CleanupReport:
     orphaned_dirs: list[OrphanedDevcontainer] = field(default_factory=list)
     dangling_images: list[ImageInfo] = field(default_factory=list)
 
-    @property
+    # Reports are built once per run and never mutated afterwards, so
+    # the aggregates are cached: the CLI re-reads them while rendering
+    # tables and prompts, and re-summing four lists each time adds up.
+    @functools.cached_property
     def total_reclaimable_bytes(self) -> int:
         """Total bytes that can be reclaimed."""
         container_bytes = sum(
@@ -100,35 +113,62 @@ class CleanupReport:
         )
         image_bytes = sum(i.size_bytes for i in self.images if not i.in_use)
         orphan_bytes = sum(o.size_bytes for o in self.orphaned_dirs)
-        dangling_bytes = sum(d.size_bytes for d in self.dangling_images)
-        return container_bytes + image_bytes + orphan_bytes + dangling_bytes
+        return (
+            container_bytes
+            + image_bytes
+            + orphan_bytes
+            + self.total_dangling_bytes
+        )
+
+    @functools.cached_property
+    def total_dangling_bytes(self) -> int:
+        """Total size of dangling images."""
+        return sum(d.size_bytes for d in self.dangling_images)
 
     @property
     def total_reclaimable_human(self) -> str:
         return _format_bytes(self.total_reclaimable_bytes)
 
-    @property
+    @functools.cached_property
     def has_reclaimable(self) -> bool:
         """Check if there's anything that can be reclaimed."""
-        has_removable_containers = any(c.is_removable for c in self.containers)
-        has_unused_images = any(not i.in_use for i in self.images)
-        return (
-            has_removable_containers
-            or has_unused_images
-            or bool(self.orphaned_dirs)
-            or bool(self.dangling_images)
+        return bool(
+            any(c.is_removable for c in self.containers)
+            or any(not i.in_use for i in self.images)
+            or self.orphaned_dirs
+            or self.dangling_images
         )
 
 
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def _format_bytes(size_bytes: int) -> str:
     """Format bytes as human-readable string."""
-    if size_bytes < 0:
-        return "0 B"
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(size_bytes) < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    if size_bytes <= 0:
+        return "0 B" if size_bytes < 0 else "0.0 B"
+    # bit_length picks the unit directly (each unit step is 10 bits), so
+    # there's no division loop - one float division for the final format
+    idx = min(len(_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_UNITS[idx]}"
+
+
+# One anchored match extracts number and unit together, replacing nine
+# endswith probes per call - this runs once per image/container/df entry
+# Unit group admits exactly B / kB / kiB and friends - a bare "iB"
+# must fail the match, not reach the multiplier table
+_SIZE_RE = re.compile(r"^\s*([0-9.]+)\s*(B|[KMGT]I?B)?\s*$", re.IGNORECASE)
+_SIZE_MULTIPLIERS = {
+    "B": 1,
+    "KB": 1024,
+    "KIB": 1024,
+    "MB": 1024**2,
+    "MIB": 1024**2,
+    "GB": 1024**3,
+    "GIB": 1024**3,
+    "TB": 1024**4,
+    "TIB": 1024**4,
+}
 
 
 def _parse_docker_size(size_str: str) -> int:
@@ -136,38 +176,54 @@ def _parse_docker_size(size_str: str) -> int:
     if not size_str or size_str == "0B":
         return 0
 
-    size_str = size_str.strip().upper()
+    # "N/A" and other non-numeric strings simply fail the match
+    match = _SIZE_RE.match(size_str)
+    if not match:
+        return 0
 
-    # Handle "N/A" or empty
-    if size_str in ("N/A", "", "0"):
+    try:
+        number = float(match.group(1))
+    except ValueError:
         return 0
 
-    # Extract number and unit
-    units = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-        "KIB": 1024,
-        "MIB": 1024**2,
-        "GIB": 1024**3,
-        "TIB": 1024**4,
-    }
+    unit = (match.group(2) or "B").upper()
+    return int(number * _SIZE_MULTIPLIERS[unit])
 
-    for unit, multiplier in sorted(units.items(), key=lambda x: -len(x[0])):
-        if size_str.endswith(unit):
-            try:
-                number = float(size_str[: -len(unit)].strip())
-                return int(number * multiplier)
-            except ValueError:
-                return 0
 
-    # If no unit found, try parsing as bytes
+def _api_filters(filters: dict) -> str:
+    """Encode a Docker API filters dict as a query-string value."""
+    return urllib.parse.quote(json.dumps(filters))
+
+
+def _api_error_message(raw: bytes) -> str:
+    """Extract the error message from a Docker API error body."""
     try:
-        return int(float(size_str))
-    except ValueError:
-        return 0
+        return json.loads(raw).get("message", "")
+    except (json.JSONDecodeError, AttributeError):
+        return ""
+
+
+def _format_api_timestamp(created: int) -> str:
+    """Render an epoch-seconds Created field like the CLI's CreatedAt."""
+    try:
+        return datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
+    except (OverflowError, OSError, ValueError):
+        return str(created)
+
+
+# Docker status strings always lead with the state word ("Up 2 hours",
+# "Exited (0) 3 days ago"); one anchored match beats six substring scans
+_STATUS_RE = re.compile(
+    r"^(Up|Exited|Paused|Created|Dead|Removing)", re.IGNORECASE
+)
+_STATUS_MAP = {
+    "up": "running",
+    "exited": "exited",
+    "paused": "paused",
+    "created": "created",
+    "dead": "dead",
+    "removing": "removing",
+}
 
 
 def _run_docker_command(
@@ -190,102 +246,298 @@ def _run_docker_command(
         return False, "", str(e)
 
 
+def _run_docker_stream(args: list[str], timeout: int = 30):
+    """Yield docker stdout lines without buffering the full output.
+
+    Popen with a line-buffered pipe keeps memory constant for listings
+    with thousands of entries and lets parsing start as soon as the
+    first line arrives, instead of materializing the whole stdout and
+    splitting it again. Yields nothing if docker is unavailable.
+    """
+    try:
+        proc = subprocess.Popen(
+            ["docker"] + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+    except (FileNotFoundError, OSError):
+        return
+
+    try:
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+    finally:
+        proc.stdout.close()
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+def _scandir_recursive(path: Path | str):
+    """Yield file DirEntry objects under path, skipping symlinks.
+
+    DirEntry answers the file/dir/symlink checks from the dirent info
+    cached by scandir, so each regular file costs a single stat at most.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+    except (OSError, PermissionError):
+        pass
+
+
+def _subtree_size(path: str) -> int:
+    """Sum file sizes under path into a private accumulator."""
+    total = 0
+    for entry in _scandir_recursive(path):
+        try:
+            total += entry.stat(follow_symlinks=False).st_size
+        except (OSError, PermissionError):
+            pass
+    return total
+
+
 def _get_directory_size(path: Path) -> int:
-    """Calculate total size of a directory in bytes."""
+    """Calculate total size of a directory in bytes.
+
+    Top-level subdirectories are walked in parallel - scandir and stat
+    release the GIL, so the syscall waits overlap. Each worker sums into
+    its own accumulator; the partial sums are combined at the end, so
+    there is no shared counter to contend on.
+    """
     total = 0
+    subdirs: list[str] = []
     try:
-        for entry in path.rglob("*"):
-            if entry.is_file() and not entry.is_symlink():
+        with os.scandir(path) as it:
+            for entry in it:
                 try:
-                    total += entry.stat().st_size
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
                 except (OSError, PermissionError):
                     pass
     except (OSError, PermissionError):
-        pass
+        return 0
+
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(os.cpu_count() or 4, len(subdirs))
+        ) as executor:
+            total += sum(executor.map(_subtree_size, subdirs))
+    elif subdirs:
+        total += _subtree_size(subdirs[0])
+
     return total
 
 
-def _is_csb_project(project_path: Path) -> bool:
+# Cached O_DIRECTORY fds, keyed by parent directory. Sibling projects
+# (e.g. everything under ~/code) share a parent; anchoring the probe at
+# its fd lets the kernel skip re-resolving the common path prefix.
+_parent_fds: dict[str, int | None] = {}
+
+
+def _parent_dir_fd(parent: str) -> int | None:
+    """Open (and cache) a directory fd for openat-style lookups."""
+    if parent in _parent_fds:
+        return _parent_fds[parent]
+    try:
+        fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        fd = None
+    # setdefault + close handles a concurrent open of the same parent
+    existing = _parent_fds.setdefault(parent, fd)
+    if existing is not fd and fd is not None:
+        os.close(fd)
+    return existing
+
+
+@functools.lru_cache(maxsize=None)
+def _is_csb_project(project_path: str) -> bool:
     """Check if a project path is a CSB-managed project.
 
     A project is CSB-managed if it has a .devcontainer/csb.json file.
+    Memoized because the same project path is probed by the container,
+    image and orphan scans within one report; cleared per report run.
+    The stat is anchored at a cached fd of the project's parent, so only
+    the last three path components are resolved per probe.
     """
-    csb_json = project_path / ".devcontainer" / "csb.json"
-    return csb_json.exists()
+    parent, name = os.path.split(project_path.rstrip("/"))
+    if name:
+        fd = _parent_dir_fd(parent)
+        if fd is not None:
+            try:
+                os.stat(f"{name}/.devcontainer/csb.json", dir_fd=fd)
+                return True
+            except FileNotFoundError:
+                return False
+            except OSError:
+                pass
+
+    return os.path.exists(
+        os.path.join(project_path, ".devcontainer", "csb.json")
+    )
+
+
+def _reset_project_probe_cache() -> None:
+    """Drop memoized probe results and close cached parent dir fds."""
+    _is_csb_project.cache_clear()
+    while _parent_fds:
+        _, fd = _parent_fds.popitem()
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
 
 def get_all_csb_containers(
     include_running: bool = False,
+    with_size: bool = True,
 ) -> list[ContainerInfo]:
     """Find all containers created by CSB.
 
     Only returns containers for projects that have a .devcontainer/csb.json file,
     which is CSB's marker file. Other devcontainer-created containers are ignored.
 
+    Prefers one Docker Engine API request (which includes labels and sizes,
+    so no per-container inspect is needed) and falls back to the docker CLI
+    when the daemon socket is unreachable.
+
     Args:
         include_running: If True, include running containers in results.
+        with_size: If True, ask the daemon for per-container disk sizes.
+            Computing sizes walks each container's filesystem, so callers
+            that don't display them should pass False; size_bytes is then 0.
 
     Returns:
         List of ContainerInfo objects for CSB-managed containers.
     """
+    try:
+        return _get_containers_api(include_running, with_size)
+    except OSError:
+        return _get_containers_cli(include_running, with_size)
+
+
+def _get_containers_api(
+    include_running: bool, with_size: bool
+) -> list[ContainerInfo]:
+    """List CSB containers with a single Engine API request."""
+    filters = _api_filters({"label": ["devcontainer.local_folder"]})
+    size = 1 if with_size else 0
+    data = api_json(
+        "GET", f"/containers/json?all=1&size={size}&filters={filters}"
+    )
+    if not isinstance(data, list):
+        return []
+
     containers = []
+    for entry in data:
+        local_folder = entry.get("Labels", {}).get("devcontainer.local_folder")
+        if not local_folder:
+            continue
+
+        if not _is_csb_project(local_folder):
+            continue
 
-    # Get all containers with devcontainer label
-    # Format: ID|Name|Status|Image|CreatedAt|LocalFolder
-    format_str = "{{.ID}}|{{.Names}}|{{.Status}}|{{.Image}}|{{.CreatedAt}}|{{.Label \"devcontainer.local_folder\"}}"
+        status = entry.get("State", "exited")
+        if status == "running" and not include_running:
+            continue
 
-    success, stdout, _ = _run_docker_command(
-        ["ps", "-a", "--format", format_str, "--no-trunc"]
+        project_path = Path(local_folder)
+
+        names = entry.get("Names") or []
+        name = names[0].lstrip("/") if names else entry.get("Id", "")[:12]
+
+        containers.append(
+            ContainerInfo(
+                id=entry.get("Id", ""),
+                name=name,
+                status=status,
+                size_bytes=entry.get("SizeRw") or 0,
+                project_path=project_path,
+                image=entry.get("Image", ""),
+                created=_format_api_timestamp(entry.get("Created", 0)),
+            )
+        )
+
+    return containers
+
+
+def _get_containers_cli(
+    include_running: bool, with_size: bool
+) -> list[ContainerInfo]:
+    """List CSB containers by shelling out to the docker CLI."""
+    containers = []
+
+    # Get all containers with devcontainer label, with sizes batched into
+    # the same listing (--size) instead of one docker inspect per container.
+    # When sizes aren't wanted the Size column is an empty literal so the
+    # line shape (and the parse below) stays the same.
+    # Format: ID|Name|Status|Image|CreatedAt|Size|LocalFolder
+    size_field = "{{.Size}}" if with_size else ""
+    format_str = (
+        "{{.ID}}|{{.Names}}|{{.Status}}|{{.Image}}|{{.CreatedAt}}|"
+        + size_field
+        + "|{{.Label \"devcontainer.local_folder\"}}"
     )
 
-    if not success or not stdout.strip():
-        return containers
+    args = ["ps", "-a", "--format", format_str]
+    if with_size:
+        args.insert(2, "--size")
+
+    status_match = _STATUS_RE.match
+    containers_append = containers.append
 
-    for line in stdout.strip().split("\n"):
+    # No --no-trunc: 12-char IDs are all downstream uses need (display
+    # shows [:12] and docker accepts prefix IDs), and shorter lines mean
+    # fewer bytes through the pipe and smaller strings to split
+    for line in _run_docker_stream(args):
         if not line:
             continue
 
-        parts = line.split("|")
-        if len(parts) < 6:
+        parts = line.split("|", 6)
+        if len(parts) < 7:
             continue
 
-        container_id, name, status_str, image, created, local_folder = parts[:6]
+        container_id, name, status_str, image, created, size_str, local_folder = (
+            parts[:7]
+        )
 
         # Skip containers without devcontainer label
         if not local_folder:
             continue
 
-        project_path = Path(local_folder)
-
         # Skip containers that aren't CSB-managed (no csb.json)
-        if not _is_csb_project(project_path):
+        if not _is_csb_project(local_folder):
             continue
 
+        project_path = Path(local_folder)
+
         # Parse status (e.g., "Up 2 hours" -> "running", "Exited (0) 3 days ago" -> "exited")
-        status_lower = status_str.lower()
-        if "up" in status_lower:
-            status = "running"
-        elif "exited" in status_lower:
-            status = "exited"
-        elif "paused" in status_lower:
-            status = "paused"
-        elif "created" in status_lower:
-            status = "created"
-        elif "dead" in status_lower:
-            status = "dead"
-        elif "removing" in status_lower:
-            status = "removing"
-        else:
-            status = "exited"
+        match = status_match(status_str)
+        status = _STATUS_MAP[match.group(1).lower()] if match else "exited"
 
         # Skip running containers unless requested
         if status == "running" and not include_running:
             continue
 
-        # Get container size
-        size_bytes = _get_container_size(container_id)
+        # Size column looks like "0B (virtual 1.2GB)" - we want the first part
+        size_bytes = _parse_docker_size(size_str.split()[0] if size_str else "0B")
 
-        containers.append(
+        containers_append(
             ContainerInfo(
                 id=container_id,
                 name=name,
@@ -300,40 +552,6 @@ def get_all_csb_containers(
     return containers
 
 
-def _get_container_size(container_id: str) -> int:
-    """Get the disk size of a container."""
-    # Use docker inspect to get size
-    success, stdout, _ = _run_docker_command(
-        ["inspect", container_id, "--format", "{{.SizeRw}}"]
-    )
-
-    if success and stdout.strip():
-        try:
-            return int(stdout.strip())
-        except ValueError:
-            pass
-
-    # Fallback: use docker ps --size (slower but more reliable)
-    success, stdout, _ = _run_docker_command(
-        [
-            "ps",
-            "-a",
-            "--filter",
-            f"id={container_id}",
-            "--format",
-            "{{.Size}}",
-            "--size",
-        ]
-    )
-
-    if success and stdout.strip():
-        # Format is like "0B (virtual 1.2GB)" - we want the first part
-        size_str = stdout.strip().split()[0] if stdout.strip() else "0B"
-        return _parse_docker_size(size_str)
-
-    return 0
-
-
 def _get_csb_project_folder_names() -> set[str]:
     """Get folder names of all CSB-managed projects with containers.
 
@@ -342,19 +560,26 @@ def _get_csb_project_folder_names() -> set[str]:
     """
     folder_names = set()
 
-    # Get all containers with devcontainer label
-    format_str = "{{.Label \"devcontainer.local_folder\"}}"
-    success, stdout, _ = _run_docker_command(
-        ["ps", "-a", "--format", format_str]
-    )
+    try:
+        filters = _api_filters({"label": ["devcontainer.local_folder"]})
+        data = api_json("GET", f"/containers/json?all=1&filters={filters}")
+        local_folders = [
+            entry.get("Labels", {}).get("devcontainer.local_folder")
+            for entry in data or []
+        ]
+    except OSError:
+        # Get all containers with devcontainer label
+        format_str = "{{.Label \"devcontainer.local_folder\"}}"
+        success, stdout, _ = _run_docker_command(
+            ["ps", "-a", "--format", format_str]
+        )
+        local_folders = stdout.splitlines() if success else []
 
-    if success and stdout.strip():
-        for line in stdout.strip().split("\n"):
-            if not line:
-                continue
-            project_path = Path(line)
-            if _is_csb_project(project_path):
-                folder_names.add(project_path.name)
+    for local_folder in local_folders:
+        if not local_folder:
+            continue
+        if _is_csb_project(local_folder):
+            folder_names.add(Path(local_folder).name)
 
     return folder_names
 
@@ -368,33 +593,100 @@ def get_all_csb_images() -> list[ImageInfo]:
     Returns:
         List of ImageInfo objects for CSB-related images.
     """
+    # The in-use set and the CSB folder names are independent Docker
+    # queries - overlap them instead of paying both round-trips serially
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        in_use_future = executor.submit(_get_images_in_use)
+        folders_future = executor.submit(_get_csb_project_folder_names)
+        in_use_images = in_use_future.result()
+        csb_folder_names = frozenset(folders_future.result())
+
+    try:
+        return _get_images_api(in_use_images, csb_folder_names)
+    except OSError:
+        return _get_images_cli(in_use_images, csb_folder_names)
+
+
+def _get_images_api(
+    in_use_images: set[str], csb_folder_names: set[str]
+) -> list[ImageInfo]:
+    """List CSB images with a single Engine API request."""
+    data = api_json("GET", "/images/json")
+    if not isinstance(data, list):
+        return []
+
     images = []
+    for entry in data:
+        image_id = entry.get("Id", "")
+        for repo_tag in entry.get("RepoTags") or []:
+            repository, _, tag = repo_tag.rpartition(":")
+            if not repository.startswith("vsc-"):
+                continue
+
+            folder_name = _match_csb_folder(repository, csb_folder_names)
+            if folder_name is None:
+                continue
+
+            images.append(
+                ImageInfo(
+                    id=image_id,
+                    repository=repository,
+                    tag=tag,
+                    size_bytes=entry.get("Size") or 0,
+                    created=_format_api_timestamp(entry.get("Created", 0)),
+                    in_use=image_id in in_use_images or repo_tag in in_use_images,
+                    is_dangling=False,
+                )
+            )
+
+    return images
+
+
+def _match_csb_folder(
+    repository: str, csb_folder_names: frozenset[str]
+) -> str | None:
+    """Match a vsc-{folder}-{hash} image repository to a CSB project folder.
+
+    Devcontainer image names are always vsc-{folder}-{64-hex-hash}, so
+    the folder is the fixed slice between the prefix and the hash - an
+    O(1) set lookup instead of a startswith scan over every folder name.
+    """
+    if len(repository) > 69 and repository[-65] == "-":
+        candidate = repository[4:-65]
+        if candidate in csb_folder_names:
+            return candidate
+        return None
+
+    # Malformed name (no 64-char hash suffix): fall back to a prefix scan
+    name_part = repository[4:]  # Remove "vsc-" prefix
+    for csb_folder in csb_folder_names:
+        if name_part.startswith(csb_folder + "-"):
+            return csb_folder
+    return None
+
+
+def _get_images_cli(
+    in_use_images: set[str], csb_folder_names: set[str]
+) -> list[ImageInfo]:
+    """List CSB images by shelling out to the docker CLI."""
+    images = []
+
+    images_append = images.append
 
     # Devcontainer images follow pattern: vsc-{project_name}-{hash}
     # Format: ID|Repository|Tag|Size|CreatedAt
-    success, stdout, _ = _run_docker_command(
+    for line in _run_docker_stream(
         [
             "images",
             "--format",
             "{{.ID}}|{{.Repository}}|{{.Tag}}|{{.Size}}|{{.CreatedAt}}",
             "--no-trunc",
         ]
-    )
-
-    if not success or not stdout.strip():
-        return images
-
-    # Get list of images currently in use by containers
-    in_use_images = _get_images_in_use()
-
-    # Get folder names of CSB projects to filter images
-    csb_folder_names = _get_csb_project_folder_names()
-
-    for line in stdout.strip().split("\n"):
+    ):
         if not line:
             continue
 
-        parts = line.split("|")
+        parts = line.split("|", 4)
         if len(parts) < 5:
             continue
 
@@ -404,25 +696,14 @@ def get_all_csb_images() -> list[ImageInfo]:
         if not repository.startswith("vsc-"):
             continue
 
-        # Extract folder name from image name (vsc-{folder_name}-{hash})
-        # The folder name is everything between "vsc-" and the last "-{hash}"
-        name_part = repository[4:]  # Remove "vsc-" prefix
-        # The hash is typically 64 hex chars at the end after a dash
-        # Find the folder name by removing the hash suffix
-        folder_name = None
-        for csb_folder in csb_folder_names:
-            if name_part.startswith(csb_folder + "-"):
-                folder_name = csb_folder
-                break
-
         # Skip images that don't belong to CSB projects
-        if folder_name is None:
+        if _match_csb_folder(repository, csb_folder_names) is None:
             continue
 
         size_bytes = _parse_docker_size(size_str)
         in_use = image_id in in_use_images or f"{repository}:{tag}" in in_use_images
 
-        images.append(
+        images_append(
             ImageInfo(
                 id=image_id,
                 repository=repository,
@@ -445,6 +726,25 @@ def get_dangling_images() -> list[ImageInfo]:
     """
     images = []
 
+    try:
+        filters = _api_filters({"dangling": ["true"]})
+        data = api_json("GET", f"/images/json?filters={filters}")
+        for entry in data or []:
+            images.append(
+                ImageInfo(
+                    id=entry.get("Id", ""),
+                    repository="<none>",
+                    tag="<none>",
+                    size_bytes=entry.get("Size") or 0,
+                    created=_format_api_timestamp(entry.get("Created", 0)),
+                    in_use=False,
+                    is_dangling=True,
+                )
+            )
+        return images
+    except OSError:
+        pass
+
     success, stdout, _ = _run_docker_command(
         [
             "images",
@@ -459,11 +759,11 @@ def get_dangling_images() -> list[ImageInfo]:
     if not success or not stdout.strip():
         return images
 
-    for line in stdout.strip().split("\n"):
+    for line in stdout.splitlines():
         if not line:
             continue
 
-        parts = line.split("|")
+        parts = line.split("|", 2)
         if len(parts) < 3:
             continue
 
@@ -489,27 +789,62 @@ def _get_images_in_use() -> set[str]:
     """Get set of image IDs and names currently used by containers."""
     in_use = set()
 
+    try:
+        data = api_json("GET", "/containers/json?all=1")
+        for entry in data or []:
+            if entry.get("Image"):
+                in_use.add(entry["Image"])
+            if entry.get("ImageID"):
+                in_use.add(entry["ImageID"])
+        return in_use
+    except OSError:
+        pass
+
     success, stdout, _ = _run_docker_command(
         ["ps", "-a", "--format", "{{.Image}}"]
     )
 
-    if success and stdout.strip():
-        for line in stdout.strip().split("\n"):
-            if line:
-                in_use.add(line.strip())
-
-    return in_use
+    if not success:
+        return in_use
+    return {line.strip() for line in stdout.splitlines() if line}
+
+
+def _default_search_paths() -> list[Path]:
+    """Common code directories to scan for orphaned devcontainers."""
+    home = Path.home()
+    candidates = [
+        home / "code",
+        home / "projects",
+        home / "src",
+        home / "dev",
+        home / "workspace",
+        home / "repos",
+        home / "git",
+        home / "Documents" / "code",
+        home / "Documents" / "projects",
+    ]
+    # Filter to only existing directories
+    return [p for p in candidates if p.is_dir()]
 
 
 def find_orphaned_devcontainers(
     search_paths: list[Path] | None = None,
     max_depth: int = 3,
+    deep: bool = False,
 ) -> list[OrphanedDevcontainer]:
     """Find .devcontainer directories without corresponding containers.
 
+    By default only the top-level children of each search path are
+    probed: projects are almost always direct children of a code
+    directory, and `.devcontainer/csb.json` is a fixed leaf path, so one
+    exists() per child replaces listing every subtree. Pass deep=True
+    to walk nested directories up to max_depth.
+
     Args:
         search_paths: Directories to search. Defaults to home directory common locations.
-        max_depth: Maximum directory depth to search.
+        max_depth: Maximum directory depth to search (deep mode only).
+        deep: If True, recursively walk subdirectories instead of only
+            probing top-level children.
 
     Returns:
         List of OrphanedDevcontainer objects.
@@ -517,102 +852,317 @@ def find_orphaned_devcontainers(
     orphans = []
 
     if search_paths is None:
-        # Default search paths: common code directories
-        home = Path.home()
-        search_paths = [
-            home / "code",
-            home / "projects",
-            home / "src",
-            home / "dev",
-            home / "workspace",
-            home / "repos",
-            home / "git",
-            home / "Documents" / "code",
-            home / "Documents" / "projects",
-        ]
-        # Filter to only existing directories
-        search_paths = [p for p in search_paths if p.exists() and p.is_dir()]
+        search_paths = _default_search_paths()
+
+    if not search_paths:
+        return orphans
+
+    # The Docker round-trip for known containers, each search root's walk
+    # and each orphan's sizing are all independent, blocking work - run
+    # them through one executor so total latency tracks the slowest
+    # branch instead of the sum of all of them
+    with ThreadPoolExecutor(
+        max_workers=min(8, len(search_paths) + 1)
+    ) as executor:
+        containers_future = executor.submit(
+            get_all_csb_containers, include_running=True
+        )
+        if deep:
+            walk_futures = [
+                executor.submit(_find_devcontainers_recursive, p, max_depth)
+                for p in search_paths
+            ]
+        else:
+            walk_futures = [
+                executor.submit(_shallow_devcontainer_scan, p)
+                for p in search_paths
+            ]
+
+        found_devcontainers: list[str] = []
+        for future in walk_futures:
+            found_devcontainers.extend(future.result())
+
+        container_paths = {
+            c.project_path.resolve() for c in containers_future.result()
+        }
+
+        candidates: list[tuple[Path, Path]] = []
+        for found in found_devcontainers:
+            devcontainer_path = Path(found)
+            project_path = devcontainer_path.parent
+            csb_json_path = devcontainer_path / "csb.json"
+
+            # Only consider directories with csb.json (created by this tool)
+            if not csb_json_path.exists():
+                continue
 
-    # Get all containers with their project paths
-    all_containers = get_all_csb_containers(include_running=True)
-    container_paths = {c.project_path.resolve() for c in all_containers}
+            # Check if there's a corresponding container
+            if project_path.resolve() in container_paths:
+                continue
 
-    # Search for .devcontainer directories
-    found_devcontainers: list[Path] = []
+            candidates.append((devcontainer_path, project_path))
 
-    for search_path in search_paths:
-        _find_devcontainers_recursive(
-            search_path, found_devcontainers, max_depth, current_depth=0
+        sizes = list(
+            executor.map(_get_directory_size, (dc for dc, _ in candidates))
         )
 
-    for devcontainer_path in found_devcontainers:
-        project_path = devcontainer_path.parent
-        csb_json_path = devcontainer_path / "csb.json"
-
-        # Only consider directories with csb.json (created by this tool)
-        if not csb_json_path.exists():
-            continue
-
-        # Check if there's a corresponding container
-        resolved_project = project_path.resolve()
-        has_container = resolved_project in container_paths
-
-        if not has_container:
-            size_bytes = _get_directory_size(devcontainer_path)
-            orphans.append(
-                OrphanedDevcontainer(
-                    path=devcontainer_path,
-                    project_path=project_path,
-                    size_bytes=size_bytes,
-                    has_csb_json=True,
-                    reason="no_container",
-                )
+    for (devcontainer_path, project_path), size_bytes in zip(candidates, sizes):
+        orphans.append(
+            OrphanedDevcontainer(
+                path=devcontainer_path,
+                project_path=project_path,
+                size_bytes=size_bytes,
+                has_csb_json=True,
+                reason="no_container",
             )
+        )
 
     return orphans
 
 
+# Common non-project directories that never contain nested projects
+_SKIP_DIRS = frozenset(
+    {
+        "node_modules",
+        ".git",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".cache",
+        "dist",
+        "build",
+        "target",
+    }
+)
+
+
+def _shallow_devcontainer_scan(path: Path) -> list[str]:
+    """Probe each top-level child of path for .devcontainer/csb.json.
+
+    `.devcontainer` is a literal leaf name, so there's no need to list
+    a candidate project's contents - a single exists() on the exact
+    path answers the question without scanning its subtree.
+    """
+    root = os.fspath(path)
+    results: list[str] = []
+
+    # The search path itself may be a project
+    if os.path.exists(os.path.join(root, ".devcontainer", "csb.json")):
+        results.append(os.path.join(root, ".devcontainer"))
+
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                name = entry.name
+                if name.startswith(".") or name in _SKIP_DIRS:
+                    continue
+                candidate = entry.path + "/.devcontainer"
+                if os.path.exists(candidate + "/csb.json"):
+                    results.append(candidate)
+    except (PermissionError, OSError):
+        pass
+
+    return results
+
+
 def _find_devcontainers_recursive(
     path: Path,
-    results: list[Path],
     max_depth: int,
-    current_depth: int,
-) -> None:
-    """Recursively find .devcontainer directories."""
-    if current_depth > max_depth:
-        return
+    current_depth: int = 0,
+) -> list[str]:
+    """Find .devcontainer directories under path (as path strings).
 
+    Iterative scandir walk: the dir check comes from the DirEntry d_type
+    cache (no stat per entry) and there's no Python recursion overhead.
+    Returns its own list so concurrent walks don't share state.
+    """
+    results: list[str] = []
+    stack = deque([(os.fspath(path), current_depth)])
+    while stack:
+        current, depth = stack.popleft()
+        if depth > max_depth:
+            continue
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    name = entry.name
+                    if name == ".devcontainer":
+                        results.append(entry.path)
+                    # Skip hidden and common non-project directories
+                    elif not name.startswith(".") and name not in _SKIP_DIRS:
+                        stack.append((entry.path, depth + 1))
+        except (PermissionError, OSError):
+            pass
+    return results
+
+
+# Cached reports keyed by call arguments. Each entry stores the daemon
+# and search-root fingerprint it was computed under, so a poll loop
+# regenerating the report only pays for one cheap /info round-trip and
+# a few stats while Docker state is stable.
+_report_cache: dict[tuple, tuple] = {}
+
+
+def _report_fingerprint(search_paths: list[Path]) -> tuple | None:
+    """Cheap state fingerprint: daemon counters + search-root mtimes.
+
+    Returns None when the daemon can't be queried, which disables
+    caching rather than risking a stale report.
+    """
     try:
-        for entry in path.iterdir():
-            if not entry.is_dir():
-                continue
+        data = api_json("GET", "/info")
+        counters = (
+            (
+                data.get("Containers"),
+                data.get("ContainersRunning"),
+                data.get("Images"),
+            )
+            if isinstance(data, dict)
+            else None
+        )
+    except OSError:
+        success, stdout, _ = _run_docker_command(
+            [
+                "system",
+                "info",
+                "--format",
+                "{{.Containers}}|{{.ContainersRunning}}|{{.Images}}",
+            ]
+        )
+        counters = tuple(stdout.strip().split("|", 2)) if success else None
 
-            # Skip hidden directories (except .devcontainer)
-            if entry.name.startswith(".") and entry.name != ".devcontainer":
-                continue
+    if counters is None:
+        return None
 
-            # Skip common non-project directories
-            skip_dirs = {
-                "node_modules",
-                ".git",
-                "__pycache__",
-                ".venv",
-                "venv",
-                ".cache",
-                "dist",
-                "build",
-                "target",
+    mtimes = []
+    for path in search_paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return (counters, tuple(mtimes))
+
+
+# On-disk copy of the last report, shared across processes (the
+# in-memory cache only helps within one). Reused while the fingerprint
+# matches and the entry is younger than the TTL.
+_DISK_CACHE_PATH = Path.home() / ".cache" / "csb" / "last_scan.json"
+_DISK_CACHE_TTL = 30.0  # seconds
+
+
+def _report_to_dict(report: CleanupReport) -> dict:
+    """Serialize a report for the disk cache."""
+
+    def image(i: ImageInfo) -> dict:
+        return {
+            "id": i.id,
+            "repository": i.repository,
+            "tag": i.tag,
+            "size_bytes": i.size_bytes,
+            "created": i.created,
+            "in_use": i.in_use,
+            "is_dangling": i.is_dangling,
+        }
+
+    return {
+        "containers": [
+            {
+                "id": c.id,
+                "name": c.name,
+                "status": c.status,
+                "size_bytes": c.size_bytes,
+                "project_path": str(c.project_path),
+                "image": c.image,
+                "created": c.created,
             }
-            if entry.name in skip_dirs:
-                continue
+            for c in report.containers
+        ],
+        "images": [image(i) for i in report.images],
+        "orphaned_dirs": [
+            {
+                "path": str(o.path),
+                "project_path": str(o.project_path),
+                "size_bytes": o.size_bytes,
+                "has_csb_json": o.has_csb_json,
+                "reason": o.reason,
+            }
+            for o in report.orphaned_dirs
+        ],
+        "dangling_images": [image(i) for i in report.dangling_images],
+    }
 
-            if entry.name == ".devcontainer":
-                results.append(entry)
-            else:
-                _find_devcontainers_recursive(
-                    entry, results, max_depth, current_depth + 1
-                )
-    except (PermissionError, OSError):
+
+def _report_from_dict(data: dict) -> CleanupReport:
+    """Rebuild a report from its disk-cache serialization."""
+    return CleanupReport(
+        containers=[
+            ContainerInfo(
+                id=c["id"],
+                name=c["name"],
+                status=c["status"],
+                size_bytes=c["size_bytes"],
+                project_path=Path(c["project_path"]),
+                image=c["image"],
+                created=c["created"],
+            )
+            for c in data["containers"]
+        ],
+        images=[ImageInfo(**i) for i in data["images"]],
+        orphaned_dirs=[
+            OrphanedDevcontainer(
+                path=Path(o["path"]),
+                project_path=Path(o["project_path"]),
+                size_bytes=o["size_bytes"],
+                has_csb_json=o["has_csb_json"],
+                reason=o["reason"],
+            )
+            for o in data["orphaned_dirs"]
+        ],
+        dangling_images=[ImageInfo(**i) for i in data["dangling_images"]],
+    )
+
+
+def _load_disk_report(key_json: str, fingerprint_json: str) -> CleanupReport | None:
+    """Return the disk-cached report if fresh and matching, else None."""
+    try:
+        st = os.stat(_DISK_CACHE_PATH)
+        if time.time() - st.st_mtime > _DISK_CACHE_TTL:
+            return None
+        with open(_DISK_CACHE_PATH, "rb") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if data.get("key") != key_json or data.get("fingerprint") != fingerprint_json:
+        return None
+    try:
+        return _report_from_dict(data["report"])
+    except (KeyError, TypeError):
+        # Schema drift from an older version: treat as a miss
+        return None
+
+
+def _store_disk_report(
+    key_json: str, fingerprint_json: str, report: CleanupReport
+) -> None:
+    """Best-effort persist of the report; failures never break cleanup."""
+    try:
+        _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _DISK_CACHE_PATH.write_text(
+            json.dumps(
+                {
+                    "key": key_json,
+                    "fingerprint": fingerprint_json,
+                    "report": _report_to_dict(report),
+                },
+                separators=(",", ":"),
+            )
+        )
+    except OSError:
         pass
 
 
@@ -620,29 +1170,117 @@ def generate_cleanup_report(
     include_running: bool = False,
     search_paths: list[Path] | None = None,
     include_dangling: bool = True,
+    refresh: bool = False,
 ) -> CleanupReport:
     """Generate a complete cleanup report.
 
+    Repeated calls reuse the previous report while the daemon's
+    container/image counters and the search roots' mtimes are
+    unchanged; pass refresh=True to force a full re-scan.
+
     Args:
         include_running: Include running containers in report.
         search_paths: Paths to search for orphaned devcontainers.
         include_dangling: Include dangling images in report.
+        refresh: If True, bypass the cached report.
 
     Returns:
         CleanupReport with all findings.
     """
-    containers = get_all_csb_containers(include_running=include_running)
-    images = get_all_csb_images()
-    orphans = find_orphaned_devcontainers(search_paths=search_paths)
-    dangling = get_dangling_images() if include_dangling else []
+    if search_paths is None:
+        search_paths = _default_search_paths()
 
-    return CleanupReport(
+    cache_key = (include_running, tuple(search_paths), include_dangling)
+    fingerprint = _report_fingerprint(search_paths)
+    key_json = json.dumps(
+        [include_running, [str(p) for p in search_paths], include_dangling]
+    )
+    fingerprint_json = json.dumps(fingerprint)
+
+    if not refresh and fingerprint is not None:
+        cached = _report_cache.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        # Cross-process: another recent invocation may have scanned already
+        disk_report = _load_disk_report(key_json, fingerprint_json)
+        if disk_report is not None:
+            _report_cache[cache_key] = (fingerprint, disk_report)
+            return disk_report
+
+    # Stale entries from a previous run must not suppress re-checking
+    # projects that gained or lost their csb.json in the meantime
+    _reset_project_probe_cache()
+
+    # The four scans are independent, blocking on Docker round-trips or
+    # filesystem walks - run them concurrently so the report takes about
+    # as long as its slowest branch rather than the sum of all four
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        containers_future = executor.submit(
+            get_all_csb_containers, include_running=include_running
+        )
+        images_future = executor.submit(get_all_csb_images)
+        orphans_future = executor.submit(
+            find_orphaned_devcontainers, search_paths=search_paths
+        )
+        dangling_future = (
+            executor.submit(get_dangling_images) if include_dangling else None
+        )
+
+        containers = containers_future.result()
+        images = images_future.result()
+        orphans = orphans_future.result()
+        dangling = dangling_future.result() if dangling_future else []
+
+    report = CleanupReport(
         containers=containers,
         images=images,
         orphaned_dirs=orphans,
         dangling_images=dangling,
     )
 
+    if fingerprint is not None:
+        _report_cache[cache_key] = (fingerprint, report)
+        _store_disk_report(key_json, fingerprint_json, report)
+
+    return report
+
+
+def _probe_daemon_rtt() -> float | None:
+    """Median round-trip time of three /_ping calls, or None if unreachable."""
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        try:
+            api_request("GET", "/_ping", timeout=2)
+        except OSError:
+            return None
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[1]
+
+
+def removal_workers(requested: int = 0, jobs: int = 1) -> int:
+    """Pick a thread count for fanning removals out to the daemon.
+
+    A fixed fan-out can overload a slow daemon, so when no explicit
+    count is requested (requested <= 0) the daemon is pinged and the
+    concurrency scaled to its round-trip time: ~16 workers against a
+    local sub-millisecond socket, down to 2 when calls take half a
+    second, and 2 when the socket is down (the CLI fallback path).
+
+    Args:
+        requested: Explicit worker count from --parallel; 0 means auto.
+        jobs: Number of removals queued; the result never exceeds it.
+
+    Returns:
+        Worker count, at least 1.
+    """
+    if requested > 0:
+        return max(1, min(requested, jobs))
+    rtt = _probe_daemon_rtt()
+    auto = 2 if rtt is None else max(1, min(16, int(1.0 / max(rtt, 1e-6))))
+    return max(1, min(auto, jobs))
+
 
 def remove_container(container_id: str, force: bool = False) -> tuple[bool, str]:
     """Remove a container by ID.
@@ -654,6 +1292,17 @@ def remove_container(container_id: str, force: bool = False) -> tuple[bool, str]
     Returns:
         Tuple of (success, message).
     """
+    try:
+        force_flag = "true" if force else "false"
+        status, raw = api_request(
+            "DELETE", f"/containers/{container_id}?force={force_flag}"
+        )
+        if status == 204:
+            return True, f"Removed container {container_id[:12]}"
+        return False, _api_error_message(raw) or "Failed to remove container"
+    except OSError:
+        pass
+
     args = ["rm"]
     if force:
         args.append("-f")
@@ -676,6 +1325,17 @@ def remove_image(image_id: str, force: bool = False) -> tuple[bool, str]:
     Returns:
         Tuple of (success, message).
     """
+    try:
+        force_flag = "true" if force else "false"
+        status, raw = api_request(
+            "DELETE", f"/images/{image_id}?force={force_flag}", timeout=60
+        )
+        if 200 <= status < 300:
+            return True, f"Removed image {image_id[:12]}"
+        return False, _api_error_message(raw) or "Failed to remove image"
+    except OSError:
+        pass
+
     args = ["rmi"]
     if force:
         args.append("-f")
@@ -723,6 +1383,18 @@ def prune_dangling_images() -> tuple[bool, str, int]:
     if not dangling:
         return True, "No dangling images to remove", 0
 
+    try:
+        filters = _api_filters({"dangling": ["true"]})
+        result = api_json(
+            "POST", f"/images/prune?filters={filters}", timeout=120
+        )
+        if result is not None:
+            reclaimed = result.get("SpaceReclaimed", total_size)
+            return True, f"Removed {len(dangling)} dangling image(s)", reclaimed
+        return False, "Failed to prune images", 0
+    except OSError:
+        pass
+
     success, stdout, stderr = _run_docker_command(
         ["image", "prune", "-f"], timeout=120
     )
@@ -732,16 +1404,22 @@ def prune_dangling_images() -> tuple[bool, str, int]:
     return False, stderr or "Failed to prune images", 0
 
 
+# `docker system df` emits these exact Type labels; a dict lookup maps
+# them to result keys in O(1) instead of lowercased substring tests
+_DF_TYPE_KEYS = {
+    "Containers": "containers",
+    "Images": "images",
+    "Local Volumes": "volumes",
+    "Build Cache": "build_cache",
+}
+
+
 def get_docker_disk_usage() -> dict:
     """Get overall Docker disk usage.
 
     Returns:
         Dict with 'containers', 'images', 'volumes', 'build_cache' sizes.
     """
-    success, stdout, _ = _run_docker_command(
-        ["system", "df", "--format", "{{json .}}"]
-    )
-
     result = {
         "containers": 0,
         "images": 0,
@@ -749,27 +1427,42 @@ def get_docker_disk_usage() -> dict:
         "build_cache": 0,
     }
 
+    try:
+        data = api_json("GET", "/system/df")
+        if isinstance(data, dict):
+            result["images"] = data.get("LayersSize") or 0
+            result["containers"] = sum(
+                c.get("SizeRw") or 0 for c in data.get("Containers") or []
+            )
+            result["volumes"] = sum(
+                (v.get("UsageData") or {}).get("Size") or 0
+                for v in data.get("Volumes") or []
+            )
+            result["build_cache"] = sum(
+                b.get("Size") or 0
+                for b in data.get("BuildCache") or []
+                if not b.get("Shared")
+            )
+        return result
+    except OSError:
+        pass
+
+    success, stdout, _ = _run_docker_command(
+        ["system", "df", "--format", "{{json .}}"]
+    )
+
     if not success or not stdout.strip():
         return result
 
-    for line in stdout.strip().split("\n"):
+    for line in stdout.splitlines():
         if not line:
             continue
         try:
             data = json.loads(line)
-            type_name = data.get("Type", "").lower()
-            size_str = data.get("Size", "0B")
-            size_bytes = _parse_docker_size(size_str)
-
-            if "container" in type_name:
-                result["containers"] = size_bytes
-            elif "image" in type_name:
-                result["images"] = size_bytes
-            elif "volume" in type_name:
-                result["volumes"] = size_bytes
-            elif "build" in type_name or "cache" in type_name:
-                result["build_cache"] = size_bytes
         except json.JSONDecodeError:
             continue
+        key = _DF_TYPE_KEYS.get(data.get("Type", ""))
+        if key:
+            result[key] = _parse_docker_size(data.get("Size", "0B"))
 
     return result
@@ -1,39 +1,174 @@
 """CLI commands for managing Claude context (CLAUDE.md, skills, agents, commands)."""
 
+import functools
+import json
+import os
+
 import typer
 from rich.console import Console
+from typer.core import TyperGroup
 from pathlib import Path
 
-from csb.devcontainer import DevContainer
-from csb.claude_context import ClaudeContext, ClaudeContextConfig
+# DevContainer and ClaudeContext are imported inside the commands that
+# use them: `claude add`/`claude remove` only touch csb.json and skip
+# the transitive docker/subprocess import chain entirely.
 from csb.exceptions import CsbError
 
 console = Console()
 
+
+class _CsbErrorGroup(TyperGroup):
+    """Click group that reports CsbError once for all subcommands.
+
+    A single handler around dispatch replaces the per-command decorator:
+    commands raise CsbError freely without a wrapper frame (and its
+    functools.wraps introspection) on every call.
+    """
+
+    def invoke(self, ctx):
+        try:
+            return super().invoke(ctx)
+        except CsbError as e:
+            console.print(f"[red]Error:[/] {e}")
+            raise typer.Exit(1)
+
+
 claude_app = typer.Typer(
     name="claude",
     help="Manage Claude context (CLAUDE.md, skills, agents, commands)",
     no_args_is_help=True,
+    cls=_CsbErrorGroup,
 )
 
 
-def handle_csb_errors(func):
-    """Decorator to handle CsbError exceptions gracefully."""
-    import functools
+@functools.lru_cache(maxsize=1)
+def _home() -> Path:
+    """Memoized Path.home() - the HOME lookup never changes mid-process."""
+    return Path.home()
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except CsbError as e:
-            console.print(f"[red]Error:[/] {e}")
-            raise typer.Exit(1)
 
-    return wrapper
+@functools.lru_cache(maxsize=32)
+def _resolve(path: Path) -> Path:
+    """Memoized Path.resolve().
+
+    resolve() walks every component with lstat/readlink; commands invoked
+    repeatedly in one process (batched adds, tests) resolve the same
+    argument each time. Assumes the working directory is stable for the
+    life of the process, which holds for a CLI.
+    """
+    return path.resolve()
+
+
+@functools.lru_cache(maxsize=16)
+def _paths(project: Path) -> tuple[Path, Path, Path]:
+    """Resolved (project, .devcontainer, csb.json) paths for a project."""
+    project_path = _resolve(project)
+    devcontainer_path = project_path / ".devcontainer"
+    return project_path, devcontainer_path, devcontainer_path / "csb.json"
+
+
+# Status glyphs reused across the list report. Plain markup constants
+# rather than rich.text.Text: the report is assembled with str.join and
+# parsed in a single console.print, so prebuilt Text objects would force
+# per-line prints again.
+_OK = "[green]✓[/]"
+_WARN = "[yellow]![/]"
+
+# Context attributes shown by `claude list`, as (dict key, display label)
+_CONTEXT_KEYS = (
+    ("claude_md", "CLAUDE.md"),
+    ("rules_dir", "rules/"),
+    ("skills_dir", "skills/"),
+    ("agents_dir", "agents/"),
+    ("commands_dir", "commands/"),
+)
+
+# Parsed csb.json per path, keyed by (st_mtime_ns, st_size). Chained
+# invocations (sync then refresh, batched add calls) re-read the same
+# file; the stat key keeps the cache honest against external edits.
+_csb_json_cache: dict[Path, tuple[int, int, dict]] = {}
+
+
+def _load_csb_json(csb_json_path: Path) -> dict | None:
+    """Parse csb.json, memoized on its current stat; None if missing."""
+    try:
+        st = os.stat(csb_json_path)
+    except (FileNotFoundError, NotADirectoryError):
+        _csb_json_cache.pop(csb_json_path, None)
+        return None
+    entry = _csb_json_cache.get(csb_json_path)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+    try:
+        # json.load on a binary handle feeds the C parser bytes directly,
+        # skipping read_text()'s intermediate str; FileNotFoundError here
+        # covers the file vanishing between the stat and the open.
+        with csb_json_path.open("rb") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        _csb_json_cache.pop(csb_json_path, None)
+        return None
+    _csb_json_cache[csb_json_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _store_csb_json(csb_json_path: Path, data: dict, *, pretty: bool = False) -> None:
+    """Write csb.json and refresh the parse cache with the new stat.
+
+    Compact by default: the sync paths rewrite the file on every run and
+    only the CLI reads it back. add/remove pass pretty=True since those
+    edits are user-initiated and likely to be inspected or diffed.
+    """
+    # json.dump streams into the file handle, avoiding the full
+    # intermediate str (and its encode copy) that write_text(dumps(...))
+    # would build.
+    with csb_json_path.open("w") as f:
+        if pretty:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(",", ":"))
+    st = os.stat(csb_json_path)
+    _csb_json_cache[csb_json_path] = (st.st_mtime_ns, st.st_size, data)
+    # The stored dict object survives the write, so the derived config
+    # must be rebuilt from its (possibly mutated) contents next time
+    _config_cache.pop(csb_json_path, None)
+
+
+# ClaudeContextConfig built from each parsed csb.json, validated once per
+# parse. Keyed on the parsed dict's identity: a new parse (or a write)
+# replaces or evicts the entry.
+_config_cache: dict[Path, tuple[dict, object]] = {}
+
+
+def _load_config(csb_json_path: Path) -> tuple[dict, "object"]:
+    """Load csb.json and its ClaudeContextConfig, building each at most once.
+
+    Returns ({}, default config) when the file is missing. The returned
+    config is treated as read-only by all callers.
+    """
+    from csb.claude_context import ClaudeContextConfig
+
+    csb_config = _load_csb_json(csb_json_path)
+    if csb_config is None:
+        return {}, ClaudeContextConfig()
+    entry = _config_cache.get(csb_json_path)
+    if entry is not None and entry[0] is csb_config:
+        return csb_config, entry[1]
+    config = ClaudeContextConfig.from_dict(csb_config.get("claude_context", {}))
+    _config_cache[csb_json_path] = (csb_config, config)
+    return csb_config, config
+
+
+def _require_devcontainer(devcontainer_path: Path) -> None:
+    """Exit with the init hint unless .devcontainer/ exists - one stat."""
+    try:
+        devcontainer_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        console.print("[red]Error:[/] No .devcontainer/ found. Run `csb init` first.")
+        raise typer.Exit(1)
 
 
 @claude_app.command("list")
-@handle_csb_errors
 def list_context(
     path: Path = typer.Argument(
         Path("."),
@@ -45,83 +180,58 @@ def list_context(
     Shows global ~/.claude/ content, discovered parent contexts,
     and what has been copied to .devcontainer/claude-context/.
     """
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
+    from csb.claude_context import ClaudeContext
 
-    # Load config if exists
-    csb_json_path = devcontainer_path / "csb.json"
-    if csb_json_path.exists():
-        import json
+    project_path, devcontainer_path, csb_json_path = _paths(path)
 
-        csb_config = json.loads(csb_json_path.read_text())
-        config = ClaudeContextConfig.from_dict(csb_config.get("claude_context", {}))
-    else:
-        config = ClaudeContextConfig()
+    # Load config if exists
+    csb_config, config = _load_config(csb_json_path)
 
     ctx = ClaudeContext(project_path)
     info = ctx.list_contexts(config)
 
-    # Global context
-    console.print("\n[bold]Global Context (~/.claude/)[/]")
+    # Accumulate the whole report and print once: one markup parse and
+    # one write instead of a parse+flush per line.
+    lines = ["", "[bold]Global Context (~/.claude/)[/]"]
+
     if info["global"]:
         global_ctx = info["global"]
-        items = []
-        if global_ctx.get("claude_md"):
-            items.append("CLAUDE.md")
-        if global_ctx.get("rules_dir"):
-            items.append("rules/")
-        if global_ctx.get("skills_dir"):
-            items.append("skills/")
-        if global_ctx.get("agents_dir"):
-            items.append("agents/")
-        if global_ctx.get("commands_dir"):
-            items.append("commands/")
-        console.print(f"  [green]✓[/] Mounted: {', '.join(items)}")
+        items = [label for key, label in _CONTEXT_KEYS if global_ctx.get(key)]
+        lines.append(f"  {_OK} Mounted: {', '.join(items)}")
     else:
-        console.print("  [dim]No global Claude context found[/]")
+        lines.append("  [dim]No global Claude context found[/]")
 
-    # Parent contexts
-    console.print("\n[bold]Parent Contexts[/]")
+    lines.append("")
+    lines.append("[bold]Parent Contexts[/]")
     if info["parents"]:
         for parent in info["parents"]:
             depth = parent["relative_depth"]
             source = parent["source_path"]
-            items = []
-            if parent.get("claude_md"):
-                items.append("CLAUDE.md")
-            if parent.get("rules_dir"):
-                items.append("rules/")
-            if parent.get("skills_dir"):
-                items.append("skills/")
-            if parent.get("agents_dir"):
-                items.append("agents/")
-            if parent.get("commands_dir"):
-                items.append("commands/")
-
-            status = "[green]✓[/]" if info["copied"] else "[yellow]![/]"
-            console.print(f"  {status} Level {depth}: {source}")
-            console.print(f"      Found: {', '.join(items)}")
+            items = [label for key, label in _CONTEXT_KEYS if parent.get(key)]
+
+            status = _OK if info["copied"] else _WARN
+            lines.append(f"  {status} Level {depth}: {source}")
+            lines.append(f"      Found: {', '.join(items)}")
 
         # Sync status - only show if there are parents to sync
-        console.print("\n[bold]Sync Status[/]")
+        lines.append("")
+        lines.append("[bold]Sync Status[/]")
         context_dir = devcontainer_path / "claude-context"
         if context_dir.exists() and info["copied"]:
-            console.print(
-                "  [green]✓[/] Context copied to .devcontainer/claude-context/"
-            )
-            console.print(f"      {len(info['copied'])} items synced")
+            lines.append(f"  {_OK} Context copied to .devcontainer/claude-context/")
+            lines.append(f"      {len(info['copied'])} items synced")
         else:
-            console.print(
-                "  [yellow]![/] Not synced - run [cyan]csb claude sync[/] to copy parent contexts"
+            lines.append(
+                f"  {_WARN} Not synced - run [cyan]csb claude sync[/] to copy parent contexts"
             )
     else:
-        console.print("  [dim]No parent Claude context found[/]")
+        lines.append("  [dim]No parent Claude context found[/]")
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 @claude_app.command("sync")
-@handle_csb_errors
 def sync_context(
     path: Path = typer.Argument(
         Path("."),
@@ -134,23 +244,15 @@ def sync_context(
     directories into .devcontainer/claude-context/ so they're available
     in the container.
     """
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
+    from csb.claude_context import ClaudeContext
+    from csb.devcontainer import DevContainer
 
-    if not devcontainer_path.exists():
-        console.print("[red]Error:[/] No .devcontainer/ found. Run `csb init` first.")
-        raise typer.Exit(1)
+    project_path, devcontainer_path, csb_json_path = _paths(path)
 
-    # Load config
-    import json
+    _require_devcontainer(devcontainer_path)
 
-    csb_json_path = devcontainer_path / "csb.json"
-    if csb_json_path.exists():
-        csb_config = json.loads(csb_json_path.read_text())
-        config = ClaudeContextConfig.from_dict(csb_config.get("claude_context", {}))
-    else:
-        config = ClaudeContextConfig()
-        csb_config = {}
+    # Load config
+    csb_config, config = _load_config(csb_json_path)
 
     ctx = ClaudeContext(project_path)
 
@@ -162,10 +264,12 @@ def sync_context(
         for dest, source in copied.items():
             console.print(f"  [dim]{source}[/] → [cyan]{dest}[/]")
 
-        # Update csb.json with sources
+        # Update csb.json with sources and the fingerprint that lets
+        # `csb claude refresh` skip an immediate re-sync
         csb_config["claude_context"] = config.to_dict()
         csb_config["claude_context_sources"] = copied
-        csb_json_path.write_text(json.dumps(csb_config, indent=2))
+        csb_config["claude_context_fingerprint"] = ctx.sources_fingerprint(config)
+        _store_csb_json(csb_json_path, csb_config)
 
         # Check if container is running
         dc = DevContainer(project_path)
@@ -177,20 +281,24 @@ def sync_context(
             console.print("\n[dim]Changes will be applied on next `csb start`[/]")
     else:
         console.print("\n[dim]No parent Claude context found to sync.[/]")
-        # Only mention global context if it exists and is enabled
-        global_claude = Path.home() / ".claude"
-        if (
-            config.include_global
-            and global_claude.exists()
-            and any(global_claude.iterdir())
-        ):
+        # Only mention global context if it exists and is enabled.
+        # scandir yields raw DirEntry objects and stops after the first
+        # one - no per-entry Path construction like iterdir, and a
+        # missing ~/.claude just raises instead of needing exists().
+        has_global = False
+        if config.include_global:
+            try:
+                with os.scandir(_home() / ".claude") as it:
+                    has_global = next(iter(it), None) is not None
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        if has_global:
             console.print(
                 "[dim]Your global ~/.claude/ context is already mounted automatically.[/]"
             )
 
 
 @claude_app.command("refresh")
-@handle_csb_errors
 def refresh_context(
     path: Path = typer.Argument(
         Path("."),
@@ -206,40 +314,40 @@ def refresh_context(
     Use this when you've updated CLAUDE.md, skills, agents, or commands
     in parent directories and want the container to pick up changes.
     """
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
+    from csb.claude_context import ClaudeContext
+    from csb.devcontainer import DevContainer
 
-    if not devcontainer_path.exists():
-        console.print("[red]Error:[/] No .devcontainer/ found. Run `csb init` first.")
-        raise typer.Exit(1)
+    project_path, devcontainer_path, csb_json_path = _paths(path)
 
-    # Load config
-    import json
+    _require_devcontainer(devcontainer_path)
 
-    csb_json_path = devcontainer_path / "csb.json"
-    if csb_json_path.exists():
-        csb_config = json.loads(csb_json_path.read_text())
-        config = ClaudeContextConfig.from_dict(csb_config.get("claude_context", {}))
-    else:
-        config = ClaudeContextConfig()
-        csb_config = {}
+    # Load config
+    csb_config, config = _load_config(csb_json_path)
 
     ctx = ClaudeContext(project_path)
     dc = DevContainer(project_path)
 
-    # Step 1: Re-sync from sources
-    with console.status("[bold blue]Syncing Claude context..."):
-        copied = ctx.sync(config)
+    # Step 1: Re-sync from sources. If the fingerprint stored by the
+    # last sync still matches, nothing upstream changed - skip the
+    # discovery walk and copy entirely and go straight to the container.
+    fingerprint = ctx.sources_fingerprint(config)
+    if csb_config.get("claude_context_fingerprint") == fingerprint:
+        copied = csb_config.get("claude_context_sources", {})
+        console.print("[dim]Context sources unchanged - skipping sync[/]")
+    else:
+        with console.status("[bold blue]Syncing Claude context..."):
+            copied = ctx.sync(config)
 
-    if copied:
-        console.print(f"[green]✓[/] Synced {len(copied)} items from sources")
+        if copied:
+            console.print(f"[green]✓[/] Synced {len(copied)} items from sources")
 
-        # Update csb.json
-        csb_config["claude_context"] = config.to_dict()
-        csb_config["claude_context_sources"] = copied
-        csb_json_path.write_text(json.dumps(csb_config, indent=2))
-    else:
-        console.print("[dim]No parent context to sync[/]")
+            # Update csb.json
+            csb_config["claude_context"] = config.to_dict()
+            csb_config["claude_context_sources"] = copied
+            csb_config["claude_context_fingerprint"] = ctx.sources_fingerprint(config)
+            _store_csb_json(csb_json_path, csb_config)
+        else:
+            console.print("[dim]No parent context to sync[/]")
 
     # Step 2: If container is running, refresh inside it
     container_id = dc.get_container_id()
@@ -267,7 +375,6 @@ def refresh_context(
 
 
 @claude_app.command("add")
-@handle_csb_errors
 def add_source(
     source: str = typer.Argument(
         ...,
@@ -290,12 +397,9 @@ def add_source(
         csb claude add ~/my-org/.claude/skills/
         csb claude add /path/to/shared-agents/
     """
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
+    project_path, devcontainer_path, csb_json_path = _paths(path)
 
-    if not devcontainer_path.exists():
-        console.print("[red]Error:[/] No .devcontainer/ found. Run `csb init` first.")
-        raise typer.Exit(1)
+    _require_devcontainer(devcontainer_path)
 
     source_path = Path(source).expanduser().resolve()
     if not source_path.exists():
@@ -303,33 +407,31 @@ def add_source(
         raise typer.Exit(1)
 
     # Load and update config
-    import json
-
-    csb_json_path = devcontainer_path / "csb.json"
-    if csb_json_path.exists():
-        csb_config = json.loads(csb_json_path.read_text())
-    else:
+    csb_config = _load_csb_json(csb_json_path)
+    if csb_config is None:
         csb_config = {}
 
-    claude_context = csb_config.get("claude_context", {})
-    extra = claude_context.get("extra", [])
+    # setdefault hands back the live sub-dict, so mutating it below
+    # updates csb_config directly - no trailing reassignment needed
+    claude_context = csb_config.setdefault("claude_context", {})
+    # Operate on a set for O(1) membership (and free dedup); serialize
+    # sorted so csb.json stays diff-friendly
+    extra = set(claude_context.get("extra", []))
 
     source_str = str(source_path)
     if source_str in extra:
         console.print(f"[yellow]Already added:[/] {source_path}")
         return
 
-    extra.append(source_str)
-    claude_context["extra"] = extra
-    csb_config["claude_context"] = claude_context
-    csb_json_path.write_text(json.dumps(csb_config, indent=2))
+    extra.add(source_str)
+    claude_context["extra"] = sorted(extra)
+    _store_csb_json(csb_json_path, csb_config, pretty=True)
 
     console.print(f"[green]Added:[/] {source_path}")
     console.print("[dim]Run `csb claude sync` to copy into container context[/]")
 
 
 @claude_app.command("remove")
-@handle_csb_errors
 def remove_source(
     source: str = typer.Argument(
         ...,
@@ -343,19 +445,21 @@ def remove_source(
     ),
 ):
     """Remove an extra Claude context source."""
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
-    csb_json_path = devcontainer_path / "csb.json"
+    project_path, devcontainer_path, csb_json_path = _paths(path)
 
-    if not csb_json_path.exists():
+    csb_config = _load_csb_json(csb_json_path)
+    if csb_config is None:
         console.print("[red]Error:[/] No csb.json found.")
         raise typer.Exit(1)
 
-    import json
-
-    csb_config = json.loads(csb_json_path.read_text())
-    claude_context = csb_config.get("claude_context", {})
-    extra = claude_context.get("extra", [])
+    claude_context = csb_config.setdefault("claude_context", {})
+    extra = set(claude_context.get("extra", []))
+    # Nothing configured: skip the resolve() walk entirely. Every
+    # not-found branch returns before the write below, so a mistaken
+    # remove never rewrites csb.json.
+    if not extra:
+        console.print(f"[yellow]Not found in extra sources:[/] {source}")
+        return
 
     source_path = Path(source).expanduser().resolve()
     source_str = str(source_path)
@@ -364,10 +468,9 @@ def remove_source(
         console.print(f"[yellow]Not found in extra sources:[/] {source}")
         return
 
-    extra.remove(source_str)
-    claude_context["extra"] = extra
-    csb_config["claude_context"] = claude_context
-    csb_json_path.write_text(json.dumps(csb_config, indent=2))
+    extra.discard(source_str)
+    claude_context["extra"] = sorted(extra)
+    _store_csb_json(csb_json_path, csb_config, pretty=True)
 
     console.print(f"[green]Removed:[/] {source_path}")
     console.print("[dim]Run `csb claude sync` to update container context[/]")
@@ -1,13 +1,13 @@
 """Cleanup subcommand group for csb CLI."""
 
+import functools
+import shutil
+
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.tree import Tree
-from rich.prompt import Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich import box
+from typer.core import TyperGroup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 
 from csb.cleanup import (
@@ -21,26 +21,95 @@ from csb.cleanup import (
     remove_orphaned_directory,
     prune_dangling_images,
     get_docker_disk_usage,
+    removal_workers,
     CleanupReport,
 )
 from csb.exceptions import CsbError
 
-console = Console()
+# A fixed width saves Rich re-querying the terminal size (an ioctl) on
+# every print - noticeable across the per-line removal output. Falls
+# back to 120 columns when stdout isn't a TTY (pipes, CI).
+console = Console(width=shutil.get_terminal_size((120, 40)).columns)
+
 
+class _CsbErrorGroup(TyperGroup):
+    """Click group whose dispatch reports CsbError and exits with 1.
 
-def handle_csb_errors(func):
-    """Decorator to handle CsbError exceptions gracefully."""
-    import functools
+    One try/except around invoke() covers the group callback (the
+    interactive `csb cleanup` path) and every subcommand, so commands
+    don't each carry a decorator wrapper frame.
+    """
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
+    def invoke(self, ctx):
         try:
-            return func(*args, **kwargs)
+            return super().invoke(ctx)
         except CsbError as e:
             console.print(f"[red]Error:[/] {e}")
             raise typer.Exit(1)
 
-    return wrapper
+
+# Above this many rows, Rich's per-cell measurement and markup parsing
+# dominate render time; the subcommands fall back to plain fixed-width
+# lines instead of a Table.
+_PLAIN_TABLE_THRESHOLD = 200
+
+
+@contextmanager
+def _removal_output():
+    """Coalesce per-item ✓/✗ removal lines into batched terminal writes.
+
+    Yields an append(markup_line) callable. On a terminal the block is
+    drawn through one Live region, so Rich folds N appends into ~10
+    repaints/sec instead of one render+write syscall per line; when
+    piped, everything is flushed in a single print at the end.
+    """
+    if not console.is_terminal:
+        lines: list[str] = []
+        try:
+            yield lines.append
+        finally:
+            if lines:
+                console.print("\n".join(lines))
+        return
+
+    from rich.live import Live
+    from rich.text import Text
+
+    text = Text()
+
+    def append(line: str) -> None:
+        if text:
+            text.append("\n")
+        text.append_text(Text.from_markup(line))
+
+    # Live re-renders its current renderable on each refresh, so
+    # mutating the Text in place is enough - no update() per line
+    with Live(text, console=console, refresh_per_second=10):
+        yield append
+
+
+@contextmanager
+def _maybe_progress(description: str, quiet: bool = False):
+    """Spinner context for a scan, skipped when it would be pure overhead.
+
+    Progress spawns a live-render thread that repaints ~10x/sec; for
+    quick scans, --quiet runs, or piped output that costs more than the
+    work it decorates. Yields the Progress (or None when skipped).
+    """
+    if quiet or not console.is_terminal:
+        yield None
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        progress.add_task(description, total=None)
+        yield progress
 
 
 cleanup_app = typer.Typer(
@@ -48,14 +117,97 @@ cleanup_app = typer.Typer(
     help="Clean up unused containers, images, and orphaned configurations",
     no_args_is_help=False,  # Allow running without subcommand for interactive mode
     invoke_without_command=True,
+    cls=_CsbErrorGroup,
 )
 
 
+def _render_cleanup_report_plain(report: CleanupReport) -> None:
+    """Render the cleanup report as plain text for piped/redirected output.
+
+    Skips Rich entirely - no tree layout, cell measurement or ANSI - so
+    scripts piping `csb cleanup report` into grep/awk get cheap, stable
+    lines.
+    """
+    import sys
+
+    lines = ["", "CSB Disk Usage Report"]
+
+    if report.containers:
+        lines.append("Containers:")
+        for container in report.containers:
+            removable = "" if container.is_running else "  <- removable"
+            lines.append(
+                f"  {container.name} ({container.status}) "
+                f"{container.size_human}{removable}"
+            )
+    else:
+        lines.append("Containers: none found")
+
+    if report.images:
+        lines.append("Images:")
+        for image in report.images:
+            marker = "(in use)" if image.in_use else "<- removable"
+            lines.append(f"  {image.full_name} {image.size_human} {marker}")
+    else:
+        lines.append("Images: none found")
+
+    if report.dangling_images:
+        lines.append(
+            f"Dangling images: {len(report.dangling_images)} "
+            f"({_format_bytes(report.total_dangling_bytes)})  <- removable"
+        )
+
+    if report.orphaned_dirs:
+        lines.append("Orphaned .devcontainer/ dirs:")
+        for orphan in report.orphaned_dirs:
+            lines.append(
+                f"  {orphan.project_path} {orphan.size_human}  <- removable"
+            )
+    else:
+        lines.append("Orphaned directories: none found")
+
+    lines.append("")
+    if report.has_reclaimable:
+        lines.append(f"Total reclaimable: {report.total_reclaimable_human}")
+    else:
+        lines.append("Nothing to clean up.")
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines))
+
+
+# Static report labels, parsed by Rich's markup engine once per process
+# instead of on every render (repeat renders happen under watch loops).
+# Built lazily because rich.text is only imported when a report renders.
+_label_cache: dict[str, object] = {}
+
+
+def _label(markup: str):
+    text = _label_cache.get(markup)
+    if text is None:
+        from rich.text import Text
+
+        text = _label_cache[markup] = Text.from_markup(markup)
+    return text
+
+
 def _render_cleanup_report(report: CleanupReport, include_running: bool = False) -> None:
     """Render the cleanup report with Rich formatting."""
+    if not console.is_terminal:
+        _render_cleanup_report_plain(report)
+        return
+
+    from rich import box
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.tree import Tree
+
     console.print()
 
-    # Create main tree
+    # Create main tree. Each section is one multi-line child instead of
+    # one tree node per row - Rich measures and walks children
+    # individually, so collapsing a section to a single Text keeps the
+    # render O(sections) rather than O(rows).
     tree = Tree(
         "[bold]CSB Disk Usage Report[/]",
         guide_style="dim",
@@ -63,48 +215,51 @@ def _render_cleanup_report(report: CleanupReport, include_running: bool = False)
 
     # Containers section
     if report.containers:
-        containers_branch = tree.add("[bold cyan]Containers[/]")
+        containers_branch = tree.add(_label("[bold cyan]Containers[/]"))
+        lines = []
         for container in report.containers:
             status_color = "green" if container.is_running else "dim"
             removable = "" if container.is_running else " [yellow]← removable[/]"
-            containers_branch.add(
+            lines.append(
                 f"[{status_color}]{container.name}[/] ({container.status}) "
                 f"[dim]{container.size_human}[/]{removable}"
             )
+        containers_branch.add(Text.from_markup("\n".join(lines)))
     else:
-        tree.add("[dim]Containers: none found[/]")
+        tree.add(_label("[dim]Containers: none found[/]"))
 
     # Images section
     if report.images:
-        images_branch = tree.add("[bold cyan]Images[/]")
-        for image in report.images:
-            in_use_marker = "[green](in use)[/]" if image.in_use else "[yellow]← removable[/]"
-            images_branch.add(
-                f"{image.full_name} [dim]{image.size_human}[/] {in_use_marker}"
-            )
+        images_branch = tree.add(_label("[bold cyan]Images[/]"))
+        lines = [
+            f"{image.full_name} [dim]{image.size_human}[/] "
+            + ("[green](in use)[/]" if image.in_use else "[yellow]← removable[/]")
+            for image in report.images
+        ]
+        images_branch.add(Text.from_markup("\n".join(lines)))
     else:
-        tree.add("[dim]Images: none found[/]")
+        tree.add(_label("[dim]Images: none found[/]"))
 
     # Dangling images section
     if report.dangling_images:
-        dangling_branch = tree.add("[bold cyan]Dangling Images[/]")
-        total_dangling = sum(d.size_bytes for d in report.dangling_images)
+        dangling_branch = tree.add(_label("[bold cyan]Dangling Images[/]"))
         dangling_branch.add(
             f"[dim]{len(report.dangling_images)} dangling image(s)[/] "
-            f"[dim]{report.dangling_images[0].size_human if len(report.dangling_images) == 1 else _format_bytes(total_dangling)}[/] "
+            f"[dim]{_format_bytes(report.total_dangling_bytes)}[/] "
             f"[yellow]← removable[/]"
         )
 
     # Orphaned directories section
     if report.orphaned_dirs:
-        orphans_branch = tree.add("[bold cyan]Orphaned .devcontainer/ dirs[/]")
-        for orphan in report.orphaned_dirs:
-            orphans_branch.add(
-                f"[dim]{orphan.project_path}[/] "
-                f"[dim]{orphan.size_human}[/] [yellow]← removable[/]"
-            )
+        orphans_branch = tree.add(_label("[bold cyan]Orphaned .devcontainer/ dirs[/]"))
+        lines = [
+            f"[dim]{orphan.project_path}[/] "
+            f"[dim]{orphan.size_human}[/] [yellow]← removable[/]"
+            for orphan in report.orphaned_dirs
+        ]
+        orphans_branch.add(Text.from_markup("\n".join(lines)))
     else:
-        tree.add("[dim]Orphaned directories: none found[/]")
+        tree.add(_label("[dim]Orphaned directories: none found[/]"))
 
     console.print(tree)
     console.print()
@@ -117,19 +272,23 @@ def _render_cleanup_report(report: CleanupReport, include_running: bool = False)
         console.print("[dim]Nothing to clean up.[/]")
 
 
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+# Report renders re-format the same totals (tables, summaries, JSON);
+# the cache makes repeat formatting a dict hit.
+@functools.lru_cache(maxsize=1024)
 def _format_bytes(size_bytes: int) -> str:
     """Format bytes as human-readable string."""
-    if size_bytes < 0:
-        return "0 B"
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(size_bytes) < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    if size_bytes <= 0:
+        return "0 B" if size_bytes < 0 else "0.0 B"
+    # bit_length picks the unit directly (each unit step is 10 bits), so
+    # there's no division loop - one float division for the final format
+    idx = min(len(_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_UNITS[idx]}"
 
 
 @cleanup_app.callback()
-@handle_csb_errors
 def cleanup_main(
     ctx: typer.Context,
     dry_run: bool = typer.Option(
@@ -180,6 +339,23 @@ def cleanup_main(
         "-s",
         help="Additional paths to search for orphaned devcontainers",
     ),
+    parallel: int = typer.Option(
+        0,
+        "--parallel",
+        "-p",
+        help="Concurrent removals (0 = auto-tune from daemon latency)",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Suppress the progress spinner",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore any cached report and re-scan",
+    ),
 ):
     """Clean up unused CSB containers, images, and orphaned configurations.
 
@@ -200,32 +376,46 @@ def cleanup_main(
     if ctx.invoked_subcommand is not None:
         return
 
+    from rich.prompt import Confirm
+
     # Determine what to include
     include_all = not any([images_only, containers_only, orphans_only, dangling_only])
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold blue]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("Scanning for cleanup targets...", total=None)
-
-        # Generate report based on flags
-        report = CleanupReport()
-
-        if include_all or containers_only:
-            report.containers = get_all_csb_containers(include_running=all_containers)
-
-        if include_all or images_only:
-            report.images = get_all_csb_images()
-
-        if include_all or orphans_only:
-            search_paths = list(search_path) if search_path else None
-            report.orphaned_dirs = find_orphaned_devcontainers(search_paths=search_paths)
+    with _maybe_progress("Scanning for cleanup targets...", quiet):
+        if include_all:
+            # Full scan: go through the cached-report path shared with
+            # `csb cleanup report` (--refresh bypasses it)
+            report = generate_cleanup_report(
+                include_running=all_containers,
+                search_paths=list(search_path) if search_path else None,
+                refresh=refresh,
+            )
+        else:
+            # Partial scans stay uncached. They hit independent
+            # subsystems (docker API, filesystem walk) and block on
+            # I/O, so run the selected ones concurrently - total
+            # latency becomes the slowest scan instead of the sum,
+            # same as generate_cleanup_report.
+            report = CleanupReport()
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {}
+                if containers_only:
+                    futures["containers"] = executor.submit(
+                        get_all_csb_containers, include_running=all_containers
+                    )
+                if images_only:
+                    futures["images"] = executor.submit(get_all_csb_images)
+                if orphans_only:
+                    search_paths = list(search_path) if search_path else None
+                    futures["orphaned_dirs"] = executor.submit(
+                        find_orphaned_devcontainers, search_paths=search_paths
+                    )
+                if dangling_only:
+                    futures["dangling_images"] = executor.submit(get_dangling_images)
 
-        if include_all or dangling_only:
-            report.dangling_images = get_dangling_images()
+                for attr, future in futures.items():
+                    setattr(report, attr, future.result())
 
     # Display report
     _render_cleanup_report(report, include_running=all_containers)
@@ -254,39 +444,52 @@ def cleanup_main(
     removed_count = 0
     error_count = 0
 
-    # Remove containers
+    # Container and image removals are independent daemon round-trips;
+    # fan them out and report results as they land. Workers only talk to
+    # Docker - all printing happens on this thread.
+    jobs: list[tuple[str, str, object]] = []
+
     if include_all or containers_only:
         for container in report.containers:
             if container.is_running and not all_containers:
                 continue
-
-            with console.status(f"Removing container {container.name[:30]}..."):
-                success, message = remove_container(
-                    container.id, force=container.is_running
+            jobs.append(
+                (
+                    f"Removed container: {container.name}",
+                    f"Failed to remove {container.name}",
+                    lambda c=container: remove_container(c.id, force=c.is_running),
                 )
+            )
 
-            if success:
-                console.print(f"[green]✓[/] Removed container: {container.name}")
-                removed_count += 1
-            else:
-                console.print(f"[red]✗[/] Failed to remove {container.name}: {message}")
-                error_count += 1
-
-    # Remove images
     if include_all or images_only:
         for image in report.images:
             if image.in_use:
                 continue
+            jobs.append(
+                (
+                    f"Removed image: {image.full_name}",
+                    f"Failed to remove {image.full_name}",
+                    lambda i=image: remove_image(i.id),
+                )
+            )
 
-            with console.status(f"Removing image {image.full_name[:40]}..."):
-                success, message = remove_image(image.id)
-
-            if success:
-                console.print(f"[green]✓[/] Removed image: {image.full_name}")
-                removed_count += 1
-            else:
-                console.print(f"[red]✗[/] Failed to remove {image.full_name}: {message}")
-                error_count += 1
+    if jobs:
+        with ThreadPoolExecutor(
+            max_workers=removal_workers(parallel, len(jobs))
+        ) as executor, _removal_output() as emit:
+            futures = {
+                executor.submit(job): (ok_msg, fail_msg)
+                for ok_msg, fail_msg, job in jobs
+            }
+            for future in as_completed(futures):
+                ok_msg, fail_msg = futures[future]
+                success, message = future.result()
+                if success:
+                    emit(f"[green]✓[/] {ok_msg}")
+                    removed_count += 1
+                else:
+                    emit(f"[red]✗[/] {fail_msg}: {message}")
+                    error_count += 1
 
     # Remove dangling images
     if include_all or dangling_only:
@@ -329,7 +532,6 @@ def cleanup_main(
 
 
 @cleanup_app.command("report")
-@handle_csb_errors
 def report(
     all_containers: bool = typer.Option(
         False,
@@ -349,6 +551,17 @@ def report(
         "-j",
         help="Output as JSON",
     ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Suppress the progress spinner",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore any cached report and re-scan",
+    ),
 ):
     """Show detailed disk usage report without removing anything.
 
@@ -359,22 +572,17 @@ def report(
         csb cleanup report --all        # Include running containers
         csb cleanup report --json       # Output as JSON for scripting
     """
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold blue]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("Analyzing disk usage...", total=None)
-
+    with _maybe_progress("Analyzing disk usage...", quiet):
         search_paths = list(search_path) if search_path else None
         report = generate_cleanup_report(
             include_running=all_containers,
             search_paths=search_paths,
+            refresh=refresh,
         )
 
     if json_output:
         import json
+        import sys
 
         output = {
             "containers": [
@@ -421,7 +629,11 @@ def report(
                 "total_reclaimable_human": report.total_reclaimable_human,
             },
         }
-        console.print_json(json.dumps(output))
+        # --json is for machine consumption: stream the encoder straight
+        # to stdout instead of print_json, which would re-parse and
+        # re-tokenize the whole document just to syntax-highlight it.
+        json.dump(output, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         _render_cleanup_report(report, include_running=all_containers)
 
@@ -429,6 +641,9 @@ def report(
         console.print()
         docker_usage = get_docker_disk_usage()
         if any(docker_usage.values()):
+            from rich import box
+            from rich.table import Table
+
             usage_table = Table(
                 title="Overall Docker Disk Usage",
                 box=box.SIMPLE,
@@ -449,7 +664,6 @@ def report(
 
 
 @cleanup_app.command("containers")
-@handle_csb_errors
 def cleanup_containers(
     all_containers: bool = typer.Option(
         False,
@@ -469,6 +683,17 @@ def cleanup_containers(
         "-n",
         help="Show what would be removed",
     ),
+    with_size: bool = typer.Option(
+        False,
+        "--with-size",
+        help="Compute per-container disk sizes (slower on large daemons)",
+    ),
+    parallel: int = typer.Option(
+        0,
+        "--parallel",
+        "-p",
+        help="Concurrent removals (0 = auto-tune from daemon latency)",
+    ),
 ):
     """Remove stopped CSB containers.
 
@@ -477,7 +702,11 @@ def cleanup_containers(
         csb cleanup containers --all     # Remove all containers (including running)
         csb cleanup containers --dry-run # Show what would be removed
     """
-    containers = get_all_csb_containers(include_running=all_containers)
+    from rich.prompt import Confirm
+
+    containers = get_all_csb_containers(
+        include_running=all_containers, with_size=with_size
+    )
 
     if not containers:
         console.print("[dim]No CSB containers found.[/]")
@@ -491,27 +720,44 @@ def cleanup_containers(
         console.print("[dim]No stopped containers to remove.[/]")
         raise typer.Exit(0)
 
-    # Display what we found
+    # Display what we found. Rows are built once; str(project_path) and
+    # the name slice are computed a single time per container.
     console.print("\n[bold]Containers to remove:[/]\n")
-    table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
-    table.add_column("Name")
-    table.add_column("Status")
-    table.add_column("Size", justify="right")
-    table.add_column("Project")
-
-    total_size = 0
-    for c in containers:
-        status_color = "green" if c.is_running else "dim"
-        table.add_row(
+    total_size = sum(c.size_bytes for c in containers)
+    rows = [
+        (
             c.name[:40],
-            f"[{status_color}]{c.status}[/]",
-            c.size_human,
+            c.status,
+            "green" if c.is_running else "dim",
+            c.size_human if with_size else "—",
             str(c.project_path)[:50],
         )
-        total_size += c.size_bytes
+        for c in containers
+    ]
 
-    console.print(table)
-    console.print(f"\n[bold]Total:[/] {_format_bytes(total_size)}")
+    if len(rows) > _PLAIN_TABLE_THRESHOLD:
+        console.print(
+            "\n".join(
+                f"{name:<40}  {status:<10}  {size:>10}  {project}"
+                for name, status, _color, size, project in rows
+            ),
+            markup=False,
+            highlight=False,
+        )
+    else:
+        from rich import box
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
+        table.add_column("Name")
+        table.add_column("Status")
+        table.add_column("Size", justify="right")
+        table.add_column("Project")
+        for name, status, color, size, project in rows:
+            table.add_row(name, f"[{color}]{status}[/]", size, project)
+        console.print(table)
+    if with_size:
+        console.print(f"\n[bold]Total:[/] {_format_bytes(total_size)}")
 
     if dry_run:
         console.print("\n[dim]Dry run - no changes made.[/]")
@@ -527,18 +773,31 @@ def cleanup_containers(
             raise typer.Exit(0)
 
     console.print()
-    for container in containers:
-        success, message = remove_container(container.id, force=container.is_running)
-        if success:
-            console.print(f"[green]✓[/] {container.name}")
-        else:
-            console.print(f"[red]✗[/] {container.name}: {message}")
+    # Fan the removals out - each is a blocking daemon round-trip
+    with ThreadPoolExecutor(
+        max_workers=removal_workers(parallel, len(containers))
+    ) as executor, _removal_output() as emit:
+        futures = {
+            executor.submit(remove_container, c.id, force=c.is_running): c
+            for c in containers
+        }
+        for future in as_completed(futures):
+            container = futures[future]
+            success, message = future.result()
+            if success:
+                emit(f"[green]✓[/] {container.name}")
+            else:
+                emit(f"[red]✗[/] {container.name}: {message}")
 
-    console.print(f"\n[green]Done![/] Reclaimed ~{_format_bytes(total_size)}")
+    if with_size:
+        console.print(
+            f"\n[green]Done![/] Reclaimed ~{_format_bytes(total_size)}"
+        )
+    else:
+        console.print(f"\n[green]Done![/] Removed {len(containers)} container(s)")
 
 
 @cleanup_app.command("images")
-@handle_csb_errors
 def cleanup_images(
     force: bool = typer.Option(
         False,
@@ -557,6 +816,12 @@ def cleanup_images(
         "--dangling/--no-dangling",
         help="Include dangling images",
     ),
+    parallel: int = typer.Option(
+        0,
+        "--parallel",
+        "-p",
+        help="Concurrent removals (0 = auto-tune from daemon latency)",
+    ),
 ):
     """Remove unused CSB images.
 
@@ -567,6 +832,8 @@ def cleanup_images(
         csb cleanup images --dry-run    # Show what would be removed
         csb cleanup images --no-dangling # Skip dangling images
     """
+    from rich.prompt import Confirm
+
     images = get_all_csb_images()
     dangling = get_dangling_images() if include_dangling else []
 
@@ -577,21 +844,33 @@ def cleanup_images(
         console.print("[dim]No unused images to remove.[/]")
         raise typer.Exit(0)
 
-    total_size = 0
+    total_size = sum(i.size_bytes for i in unused_images)
 
     # Display what we found
     if unused_images:
         console.print("\n[bold]CSB images to remove:[/]\n")
-        table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
-        table.add_column("Image")
-        table.add_column("Size", justify="right")
-        table.add_column("Created")
+        rows = [(i.full_name, i.size_human, i.created[:19]) for i in unused_images]
 
-        for img in unused_images:
-            table.add_row(img.full_name, img.size_human, img.created[:19])
-            total_size += img.size_bytes
+        if len(rows) > _PLAIN_TABLE_THRESHOLD:
+            console.print(
+                "\n".join(
+                    f"{name:<50}  {size:>10}  {created}"
+                    for name, size, created in rows
+                ),
+                markup=False,
+                highlight=False,
+            )
+        else:
+            from rich import box
+            from rich.table import Table
 
-        console.print(table)
+            table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
+            table.add_column("Image")
+            table.add_column("Size", justify="right")
+            table.add_column("Created")
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
 
     if dangling:
         dangling_size = sum(d.size_bytes for d in dangling)
@@ -613,12 +892,20 @@ def cleanup_images(
 
     console.print()
 
-    for img in unused_images:
-        success, message = remove_image(img.id)
-        if success:
-            console.print(f"[green]✓[/] {img.full_name}")
-        else:
-            console.print(f"[red]✗[/] {img.full_name}: {message}")
+    if unused_images:
+        with ThreadPoolExecutor(
+            max_workers=removal_workers(parallel, len(unused_images))
+        ) as executor, _removal_output() as emit:
+            futures = {
+                executor.submit(remove_image, i.id): i for i in unused_images
+            }
+            for future in as_completed(futures):
+                img = futures[future]
+                success, message = future.result()
+                if success:
+                    emit(f"[green]✓[/] {img.full_name}")
+                else:
+                    emit(f"[red]✗[/] {img.full_name}: {message}")
 
     if dangling:
         success, message, _ = prune_dangling_images()
@@ -631,7 +918,6 @@ def cleanup_images(
 
 
 @cleanup_app.command("orphans")
-@handle_csb_errors
 def cleanup_orphans(
     search_path: list[Path] = typer.Option(
         None,
@@ -651,6 +937,12 @@ def cleanup_orphans(
         "-n",
         help="Show what would be removed",
     ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Suppress the progress spinner",
+    ),
 ):
     """Remove orphaned .devcontainer/ directories.
 
@@ -662,13 +954,9 @@ def cleanup_orphans(
         csb cleanup orphans --dry-run          # Show what would be removed
         csb cleanup orphans -s ~/extra/path    # Search additional paths
     """
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold blue]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("Scanning for orphaned directories...", total=None)
+    from rich.prompt import Confirm
+
+    with _maybe_progress("Scanning for orphaned directories...", quiet):
         search_paths = list(search_path) if search_path else None
         orphans = find_orphaned_devcontainers(search_paths=search_paths)
 
@@ -678,16 +966,25 @@ def cleanup_orphans(
 
     # Display what we found
     console.print("\n[bold]Orphaned .devcontainer/ directories:[/]\n")
-    table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
-    table.add_column("Project Path")
-    table.add_column("Size", justify="right")
+    total_size = sum(o.size_bytes for o in orphans)
+    rows = [(str(o.project_path), o.size_human) for o in orphans]
 
-    total_size = 0
-    for orphan in orphans:
-        table.add_row(str(orphan.project_path), orphan.size_human)
-        total_size += orphan.size_bytes
+    if len(rows) > _PLAIN_TABLE_THRESHOLD:
+        console.print(
+            "\n".join(f"{path:<60}  {size:>10}" for path, size in rows),
+            markup=False,
+            highlight=False,
+        )
+    else:
+        from rich import box
+        from rich.table import Table
 
-    console.print(table)
+        table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
+        table.add_column("Project Path")
+        table.add_column("Size", justify="right")
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
     console.print(f"\n[bold]Total:[/] {_format_bytes(total_size)}")
 
     if dry_run:
@@ -715,7 +1012,6 @@ def cleanup_orphans(
 
 
 @cleanup_app.command("dangling")
-@handle_csb_errors
 def cleanup_dangling(
     force: bool = typer.Option(
         False,
@@ -739,6 +1035,8 @@ def cleanup_dangling(
         csb cleanup dangling              # Remove dangling images
         csb cleanup dangling --dry-run    # Show what would be removed
     """
+    from rich.prompt import Confirm
+
     dangling = get_dangling_images()
 
     if not dangling:
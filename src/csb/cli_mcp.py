@@ -1,41 +1,139 @@
 """MCP subcommand group for csb CLI."""
 
+import os
+
 import typer
-from rich.console import Console
-from rich.table import Table
+from typer.core import TyperGroup
 from pathlib import Path
 
-from csb.devcontainer import DevContainer
-from csb.mcp import MCP_SERVERS
+# DevContainer, MCP_SERVERS and the rich renderables are imported
+# inside the commands that use them - each subcommand pays only for its
+# own dependency graph, and `csb mcp --help` for none of it.
 from csb.exceptions import CsbError
 
-console = Console()
 
+class _ConsoleProxy:
+    """Defers rich Console construction until the first print."""
+
+    _console = None
+
+    def __getattr__(self, name):
+        console = _ConsoleProxy._console
+        if console is None:
+            from rich.console import Console
+
+            console = _ConsoleProxy._console = Console()
+        return getattr(console, name)
+
+
+console = _ConsoleProxy()
+
+
+def _project_path(path: Path) -> Path:
+    """Make the --path option absolute without Path.resolve().
+
+    resolve() walks every component with stat/readlink syscalls; the
+    commands here only probe .devcontainer/ under the path and write
+    config through it, which works the same on an unresolved path.
+    """
+    return path if path.is_absolute() else Path.cwd() / path
+
+
+def _has_devcontainer(project_path: Path) -> bool:
+    """Probe for .devcontainer/ with os.path.isdir.
 
-def handle_csb_errors(func):
-    """Decorator to handle CsbError exceptions gracefully."""
-    import functools
+    The direct C call skips pathlib's object construction and stat
+    dispatch on a guard every command runs.
+    """
+    return os.path.isdir(os.path.join(str(project_path), ".devcontainer"))
+
+
+# DevContainer instances keyed by project path, reused while the
+# project's devcontainer.json is unchanged on disk (same stat-stamp
+# scheme as the config caches). Back-to-back commands in one process -
+# scripted runs, tests - skip re-construction and re-parsing.
+_devcontainer_cache: dict[Path, tuple[int, object]] = {}
+
+
+def _devcontainer_for(project_path: Path):
+    """Get (or reuse) the DevContainer for a project directory."""
+    from csb.devcontainer import DevContainer
+
+    config_path = project_path / ".devcontainer" / "devcontainer.json"
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime = -1
+    entry = _devcontainer_cache.get(project_path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    dc = DevContainer(project_path)
+    _devcontainer_cache[project_path] = (mtime, dc)
+    return dc
+
+
+class _CsbErrorGroup(TyperGroup):
+    """Click group that reports CsbError once for every subcommand.
+
+    Dispatch-level handling replaces the per-command decorator and its
+    extra wrapper frame (plus a functools.wraps metadata copy per
+    command at import time).
+    """
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
+    def invoke(self, ctx):
         try:
-            return func(*args, **kwargs)
+            return super().invoke(ctx)
         except CsbError as e:
             console.print(f"[red]Error:[/] {e}")
             raise typer.Exit(1)
 
-    return wrapper
-
 
 mcp_app = typer.Typer(
     name="mcp",
     help="Manage MCP servers in the sandbox",
     no_args_is_help=True,
+    cls=_CsbErrorGroup,
 )
 
+_STATUS_CONFIGURED = "[green]✓ configured[/]"
+_STATUS_AVAILABLE = "[dim]available[/]"
+
+# Static (name, description, env-string) rows of the built-in catalog,
+# built once per process on first use (not at import, so the lazy
+# MCP_SERVERS import is preserved). The render loop is left with just a
+# set-membership check per row.
+_catalog: tuple[tuple[str, str, str], ...] | None = None
+
+
+def _builtin_catalog() -> tuple[tuple[str, str, str], ...]:
+    global _catalog
+    if _catalog is None:
+        from csb.mcp import MCP_SERVERS
+
+        _catalog = tuple(
+            (
+                name,
+                server["description"],
+                ", ".join(server.get("required_env", [])) or "-",
+            )
+            for name, server in MCP_SERVERS.items()
+        )
+    return _catalog
+
+
+# The "Available: ..." CSV in add's unknown-server message, joined once
+# per process rather than on every miss
+_names_csv: str | None = None
+
+
+def _server_names_csv() -> str:
+    global _names_csv
+    if _names_csv is None:
+        _names_csv = ", ".join(name for name, _, _ in _builtin_catalog())
+    return _names_csv
+
 
 @mcp_app.command("add")
-@handle_csb_errors
 def add_server(
     server: str = typer.Argument(
         ...,
@@ -54,24 +152,27 @@ def add_server(
         csb mcp add github
         csb mcp add firecrawl
     """
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
+    from csb.mcp import MCP_SERVERS
 
-    if not devcontainer_path.exists():
+    project_path = _project_path(path)
+
+    if not _has_devcontainer(project_path):
         console.print("[red]Error:[/] No .devcontainer/ found. Run `csb init` first.")
         raise typer.Exit(1)
 
-    if server not in MCP_SERVERS:
+    # One probe covers both the membership check and the info lookup
+    # after a successful add
+    server_info = MCP_SERVERS.get(server)
+    if server_info is None:
         console.print(f"[red]Error:[/] Unknown MCP server: {server}")
-        console.print(f"[dim]Available: {', '.join(MCP_SERVERS.keys())}[/]")
+        console.print(f"[dim]Available: {_server_names_csv()}[/]")
         console.print("[dim]For custom servers, use `csb mcp add-custom`[/]")
         raise typer.Exit(1)
 
-    dc = DevContainer(project_path)
+    dc = _devcontainer_for(project_path)
     added = dc.add_mcp_server(server)
 
     if added:
-        server_info = MCP_SERVERS[server]
         console.print(f"[green]Added MCP server:[/] {server}")
         if server_info.get("required_env"):
             console.print(
@@ -83,7 +184,6 @@ def add_server(
 
 
 @mcp_app.command("add-custom")
-@handle_csb_errors
 def add_custom_server(
     name: str = typer.Argument(
         ...,
@@ -120,23 +220,27 @@ def add_custom_server(
         csb mcp add-custom myserver -c npx -a "-y,my-mcp-server"
         csb mcp add-custom dbserver -c node -a "server.js" -e "DB_URL,DB_PASSWORD"
     """
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
+    project_path = _project_path(path)
 
-    if not devcontainer_path.exists():
+    if not _has_devcontainer(project_path):
         console.print("[red]Error:[/] No .devcontainer/ found. Run `csb init` first.")
         raise typer.Exit(1)
 
-    # Parse args
-    args_list = [a.strip() for a in args.split(",") if a.strip()] if args else []
+    # Parse args - strip each piece once instead of once to filter and
+    # once to keep
+    args_list = (
+        [s for s in (a.strip() for a in args.split(",")) if s] if args else []
+    )
 
-    # Parse env vars
+    # Parse env vars; plain concatenation skips the f-string format
+    # machinery for the ${VAR} placeholders
     env_dict = None
     if env:
-        env_vars = [e.strip() for e in env.split(",") if e.strip()]
-        env_dict = {var: f"${{{var}}}" for var in env_vars}
+        env_dict = {
+            s: "${" + s + "}" for s in (e.strip() for e in env.split(",")) if s
+        }
 
-    dc = DevContainer(project_path)
+    dc = _devcontainer_for(project_path)
     added = dc.add_custom_mcp_server(name, command, args_list, env_dict)
 
     if added:
@@ -152,7 +256,6 @@ def add_custom_server(
 
 
 @mcp_app.command("remove")
-@handle_csb_errors
 def remove_server(
     server: str = typer.Argument(
         ...,
@@ -171,14 +274,13 @@ def remove_server(
         csb mcp remove github
         csb mcp remove my-custom-server
     """
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
+    project_path = _project_path(path)
 
-    if not devcontainer_path.exists():
+    if not _has_devcontainer(project_path):
         console.print("[red]Error:[/] No .devcontainer/ found. Run `csb init` first.")
         raise typer.Exit(1)
 
-    dc = DevContainer(project_path)
+    dc = _devcontainer_for(project_path)
     removed = dc.remove_mcp_server(server)
 
     if removed:
@@ -189,7 +291,6 @@ def remove_server(
 
 
 @mcp_app.command("list")
-@handle_csb_errors
 def list_servers(
     path: Path = typer.Option(
         Path("."),
@@ -207,59 +308,68 @@ def list_servers(
         csb mcp list
         csb mcp list --path /path/to/project
     """
-    project_path = path.resolve()
-    devcontainer_path = project_path / ".devcontainer"
+    import sys
+
+    from rich.table import Table
+
+    project_path = _project_path(path)
+    has_devcontainer = _has_devcontainer(project_path)
 
-    # Get configured servers if devcontainer exists
+    # Get configured servers if devcontainer exists. custom_servers is
+    # only truth-tested and iterated, so None stands in for the common
+    # empty case without allocating a default dict.
     configured_servers = set()
-    custom_servers = {}
+    custom_servers = None
 
-    if devcontainer_path.exists():
-        dc = DevContainer(project_path)
+    if has_devcontainer:
+        dc = _devcontainer_for(project_path)
         config = dc.get_csb_config()
         if config:
             configured_servers = set(config.get("mcp_servers", []))
-            custom_servers = config.get("custom_mcp_servers", {})
-
-    # Display built-in servers
-    console.print("\n[bold]Built-in MCP servers:[/]\n")
+            custom_servers = config.get("custom_mcp_servers")
 
+    # Build the rows from the precomputed catalog, then render
+    # everything into one capture buffer and flush it with a single
+    # write - per-print flushes dominate a list command
     table = Table(show_header=True, header_style="bold")
     table.add_column("Name", style="cyan")
     table.add_column("Status")
     table.add_column("Description")
     table.add_column("Required Env")
 
-    for name, server in MCP_SERVERS.items():
-        status = (
-            "[green]✓ configured[/]"
-            if name in configured_servers
-            else "[dim]available[/]"
+    for name, description, env_string in _builtin_catalog():
+        table.add_row(
+            name,
+            _STATUS_CONFIGURED if name in configured_servers else _STATUS_AVAILABLE,
+            description,
+            env_string,
         )
-        env_vars = ", ".join(server.get("required_env", [])) or "-"
-        table.add_row(name, status, server["description"], env_vars)
 
-    console.print(table)
+    with console.capture() as capture:
+        console.print("\n[bold]Built-in MCP servers:[/]\n")
+        console.print(table)
 
-    # Display custom servers if any
-    if custom_servers:
-        console.print("\n[bold]Custom MCP servers:[/]\n")
+        # Display custom servers if any
+        if custom_servers:
+            console.print("\n[bold]Custom MCP servers:[/]\n")
 
-        custom_table = Table(show_header=True, header_style="bold")
-        custom_table.add_column("Name", style="cyan")
-        custom_table.add_column("Command")
-        custom_table.add_column("Required Env")
+            custom_table = Table(show_header=True, header_style="bold")
+            custom_table.add_column("Name", style="cyan")
+            custom_table.add_column("Command")
+            custom_table.add_column("Required Env")
 
-        for name, server in custom_servers.items():
-            cmd = f"{server['command']} {' '.join(server.get('args', []))}"
-            env_vars = ", ".join(server.get("required_env", [])) or "-"
-            custom_table.add_row(name, cmd, env_vars)
+            for name, server in custom_servers.items():
+                cmd = f"{server['command']} {' '.join(server.get('args', []))}"
+                env_vars = ", ".join(server.get("required_env", [])) or "-"
+                custom_table.add_row(name, cmd, env_vars)
 
-        console.print(custom_table)
+            console.print(custom_table)
 
-    if not devcontainer_path.exists():
-        console.print(
-            "\n[dim]No .devcontainer/ found. Run `csb init` to get started.[/]"
-        )
+        if not has_devcontainer:
+            console.print(
+                "\n[dim]No .devcontainer/ found. Run `csb init` to get started.[/]"
+            )
+
+        console.print()
 
-    console.print()
+    sys.stdout.write(capture.get())
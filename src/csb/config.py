@@ -1,6 +1,7 @@
 """User configuration management."""
 
 import json
+import os
 from pathlib import Path
 
 
@@ -10,6 +11,11 @@ class Config:
     def __init__(self):
         self.config_dir = Path.home() / ".config" / "csb"
         self.config_path = self.config_dir / "config.json"
+        # Parsed config plus the (mtime_ns, size) it was read at - a
+        # CLI run consults several keys, and each get() re-reading and
+        # re-parsing the same bytes is wasted syscalls
+        self._cache: dict | None = None
+        self._cache_stamp: tuple[int, int] | None = None
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
@@ -27,10 +33,17 @@ class Config:
         self.config_path.write_text(json.dumps(default, indent=2))
 
     def get_all(self) -> dict:
-        """Get all configuration values."""
-        if self.config_path.exists():
-            return json.loads(self.config_path.read_text())
-        return {}
+        """Get all configuration values, parsed once per file version."""
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return {}
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._cache is None or stamp != self._cache_stamp:
+            with self.config_path.open("rb") as f:
+                self._cache = json.load(f)
+            self._cache_stamp = stamp
+        return self._cache
 
     def get(self, key: str, default=None):
         """Get a configuration value."""
@@ -38,6 +51,22 @@ class Config:
 
     def set(self, key: str, value) -> None:
         """Set a configuration value."""
-        config = self.get_all()
+        config = dict(self.get_all())
+        # No-op writes would re-serialize the file just to store the
+        # bytes it already holds
+        if key in config and config[key] == value:
+            return
         config[key] = value
-        self.config_path.write_text(json.dumps(config, indent=2))
+        # Write-then-rename so a crash mid-write can't leave a torn
+        # config.json behind (the file stays human-edited, so it keeps
+        # its indentation)
+        tmp = self.config_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(config, indent=2))
+        os.replace(tmp, self.config_path)
+        # Keep the cache warm with what was just written
+        self._cache = config
+        try:
+            st = os.stat(self.config_path)
+            self._cache_stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            self._cache_stamp = None
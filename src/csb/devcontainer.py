@@ -2,25 +2,79 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import subprocess
 import shutil
 import json
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from importlib import resources
 from typing import TYPE_CHECKING
 
-from csb.mcp import generate_mcp_config, generate_runtime_mcp_config, MCP_SERVERS
-from csb.claude_settings import generate_runtime_settings
+# csb.mcp, csb.claude_settings and csb.templates are imported inside
+# the config-writing methods - the lifecycle commands (up, down, logs,
+# is_running) never touch them, and this module is on every command's
+# import path
 from csb.exceptions import DevcontainerCliNotFoundError
-import csb.templates
 
 if TYPE_CHECKING:
     from csb.claude_context import ClaudeContextConfig
 
 
-@dataclass
+# Static lifecycle commands for devcontainer.json: run context setup if
+# it exists (postCreate), and re-run it on each start in case sources
+# changed (postStart)
+_POST_CREATE_COMMAND = (
+    "if [ -f /workspace/.devcontainer/claude-context/setup-claude-context.sh ]; then "
+    "/workspace/.devcontainer/claude-context/setup-claude-context.sh; fi"
+)
+_POST_START_COMMAND = (
+    "if [ -f /workspace/.devcontainer/claude-context/setup-claude-context.sh ]; then "
+    "/workspace/.devcontainer/claude-context/setup-claude-context.sh; "
+    "fi; echo 'Claude Sandbox ready! Run: claude --dangerously-skip-permissions'"
+)
+
+# Version of the runtime layout written by _generate_devcontainer_json
+# (mounts, workspaceFolder, postCreate guard). Recorded in csb.json so
+# needs_runtime_update can answer with one key lookup; bump it whenever
+# that layout changes.
+_RUNTIME_SCHEMA_VERSION = 1
+
+
+@functools.lru_cache(maxsize=1)
+def _builtin_dockerfile_bytes() -> bytes:
+    """Load the bundled Dockerfile template once per process.
+
+    resources.files walks the importlib machinery on every call, so
+    repeated creates (tests, scripted init) would re-open and re-decode
+    the same template.
+    """
+    from importlib import resources
+
+    import csb.templates
+
+    return resources.files(csb.templates).joinpath("Dockerfile").read_bytes()
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """Write data to path unless the file already holds those bytes.
+
+    Rewriting an identical config file still bumps its mtime, which
+    makes Docker revalidate the bind mounts and trips the stat-stamp
+    caches for nothing - re-running `csb update` with no changes should
+    leave the tree untouched.
+    """
+    try:
+        if path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    path.write_bytes(data)
+
+
+@dataclass(slots=True, frozen=True)
 class CommandResult:
     success: bool
     output: str = ""
@@ -30,11 +84,24 @@ class CommandResult:
 class DevContainer:
     """Manages devcontainer lifecycle for a project."""
 
+    _ID_UNKNOWN = object()  # sentinel: container id not yet queried
+
     def __init__(self, project_path: Path):
         self.project_path = project_path
         self.devcontainer_path = project_path / ".devcontainer"
+        self._container_id_cache = self._ID_UNKNOWN
+        # Parsed JSON keyed by the file's (mtime_ns, size) stat-stamp -
+        # one CLI command reads csb.json several times (update, the
+        # add/remove paths, needs_runtime_update), and each read was a
+        # full open+parse of the same bytes
+        self._csb_cache: tuple[tuple[int, int], dict] | None = None
+        self._devcontainer_json_cache: tuple[tuple[int, int], dict] | None = None
         self._ensure_devcontainer_cli()
 
+    def _invalidate_container_id(self) -> None:
+        """Drop the memoized container id around lifecycle changes."""
+        self._container_id_cache = self._ID_UNKNOWN
+
     def _ensure_devcontainer_cli(self) -> None:
         """Check if devcontainer CLI is installed."""
         if not shutil.which("devcontainer"):
@@ -72,101 +139,180 @@ class DevContainer:
         Args:
             dockerfile_path: Path to custom Dockerfile to copy. If None, uses built-in.
         """
+        target = self.devcontainer_path / "Dockerfile"
         if dockerfile_path:
-            # Copy custom Dockerfile
-            dockerfile_content = dockerfile_path.read_text()
+            # Copy custom Dockerfile byte-for-byte, no decode/encode
+            # round trip
+            shutil.copyfile(dockerfile_path, target)
         else:
             # Use built-in template
-            template_file = resources.files(csb.templates).joinpath("Dockerfile")
-            dockerfile_content = template_file.read_text()
-
-        (self.devcontainer_path / "Dockerfile").write_text(dockerfile_content)
+            target.write_bytes(_builtin_dockerfile_bytes())
 
     def _update_config_files(
         self,
         mcp_servers: list[str],
         custom_mcp_servers: dict | None = None,
-        claude_context: ClaudeContextConfig | None = None,
+        claude_context: ClaudeContextConfig | dict | None = None,
     ) -> None:
         """Update config files without touching Dockerfile.
 
         Writes: csb.json, devcontainer.json, .mcp.json
         Does NOT write: Dockerfile (that's only written on initial create)
+
+        claude_context may be a ClaudeContextConfig or its serialized
+        dict - the mutation paths read the dict straight out of csb.json
+        and pass it through, skipping a from_dict/to_dict round trip.
         """
-        # Write csb.json (tracks configuration for updates)
+        from concurrent.futures import ThreadPoolExecutor
+
+        from csb.claude_settings import generate_runtime_settings
+        from csb.mcp import generate_mcp_config, generate_runtime_mcp_config
+
+        if isinstance(claude_context, dict):
+            context_dict = claude_context
+            include_global = claude_context.get("global", {}).get("include", True)
+        elif claude_context:
+            context_dict = claude_context.to_dict()
+            include_global = claude_context.include_global
+        else:
+            context_dict = None
+            include_global = False
+
+        # csb.json (tracks configuration for updates)
         csb_config = {
             "version": "1.0",
+            "runtime_schema": _RUNTIME_SCHEMA_VERSION,
             "mcp_servers": mcp_servers,
             "custom_mcp_servers": custom_mcp_servers or {},
         }
-        if claude_context:
-            csb_config["claude_context"] = claude_context.to_dict()
-
-        (self.devcontainer_path / "csb.json").write_text(
-            json.dumps(csb_config, indent=2)
-        )
+        if context_dict is not None:
+            csb_config["claude_context"] = context_dict
 
-        # Write devcontainer.json
+        # devcontainer.json
         has_context_setup = (
             self.devcontainer_path / "claude-context" / "setup-claude-context.sh"
         ).exists()
         devcontainer_json = self._generate_devcontainer_json(
             mcp_servers, custom_mcp_servers, has_context_setup
         )
-        (self.devcontainer_path / "devcontainer.json").write_text(
-            json.dumps(devcontainer_json, indent=2)
-        )
 
-        # Write .mcp.json
+        # .mcp.json and the runtime MCP config (merged with global when
+        # Claude context is enabled)
         mcp_config = generate_mcp_config(mcp_servers, custom_mcp_servers)
-        (self.devcontainer_path / ".mcp.json").write_text(
-            json.dumps(mcp_config, indent=2)
-        )
-
-        # Write runtime MCP config (merged with global when Claude context is enabled)
         runtime_mcp_config = generate_runtime_mcp_config(
             mcp_servers,
             custom_mcp_servers,
-            merge_global=bool(claude_context and claude_context.include_global),
-        )
-        (self.devcontainer_path / ".mcp.runtime.json").write_text(
-            json.dumps(runtime_mcp_config, indent=2)
+            merge_global=include_global and context_dict is not None,
         )
 
-        # Write runtime settings.json with container-safe hooks
-        generate_runtime_settings(self.devcontainer_path / ".settings.runtime.json")
+        # Serialize everything up front (bytes, so text-mode writes don't
+        # re-encode), then flush the independent writes concurrently -
+        # they are pure IO and there's no ordering between the files.
+        # Byte-identical files are left untouched.
+        payloads = [
+            (self.devcontainer_path / name, json.dumps(data, indent=2).encode())
+            for name, data in (
+                ("csb.json", csb_config),
+                ("devcontainer.json", devcontainer_json),
+                (".mcp.json", mcp_config),
+                (".mcp.runtime.json", runtime_mcp_config),
+            )
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(_write_if_changed, path, data)
+                for path, data in payloads
+            ]
+            # Runtime settings.json with container-safe hooks; reads the
+            # host settings itself, so it rides along as a fifth task
+            futures.append(
+                executor.submit(
+                    generate_runtime_settings,
+                    self.devcontainer_path / ".settings.runtime.json",
+                )
+            )
+            for future in futures:
+                future.result()
+
+        # The writes above replaced both files on disk; drop the parsed
+        # caches so the next read re-stats
+        self._csb_cache = None
+        self._devcontainer_json_cache = None
 
     def get_csb_config(self) -> dict | None:
-        """Read csb.json configuration if it exists."""
+        """Read csb.json configuration if it exists.
+
+        Parsed once per file version: the stat-stamp doubles as the
+        existence check and keys the cached dict.
+        """
         csb_json_path = self.devcontainer_path / "csb.json"
-        if csb_json_path.exists():
-            try:
-                return json.loads(csb_json_path.read_text())
-            except json.JSONDecodeError:
-                logging.warning(f"Invalid JSON in {csb_json_path}, treating as missing")
-                return None
-        return None
+        try:
+            st = os.stat(csb_json_path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._csb_cache is not None and self._csb_cache[0] == stamp:
+            return self._csb_cache[1]
+        try:
+            with csb_json_path.open("rb") as f:
+                config = json.load(f)
+        except json.JSONDecodeError:
+            logging.warning(f"Invalid JSON in {csb_json_path}, treating as missing")
+            return None
+        self._csb_cache = (stamp, config)
+        return config
 
     def needs_runtime_update(self) -> bool:
         """Check if devcontainer.json includes runtime config mounts."""
+        # Fast path: configs written by this version record the runtime
+        # layout they were generated with, so one key lookup answers the
+        # question. Configs from before the sentinel fall through to the
+        # full mount scan.
+        config = self.get_csb_config()
+        if config is not None:
+            schema = config.get("runtime_schema")
+            if schema is not None:
+                return schema != _RUNTIME_SCHEMA_VERSION
+
         devcontainer_json_path = self.devcontainer_path / "devcontainer.json"
         csb_json_path = self.devcontainer_path / "csb.json"
 
-        if not devcontainer_json_path.exists() or not csb_json_path.exists():
+        try:
+            st = os.stat(devcontainer_json_path)
+        except OSError:
+            return False
+        if not csb_json_path.exists():
             return False
 
-        try:
-            config = json.loads(devcontainer_json_path.read_text())
-        except json.JSONDecodeError:
-            return True
+        stamp = (st.st_mtime_ns, st.st_size)
+        if (
+            self._devcontainer_json_cache is not None
+            and self._devcontainer_json_cache[0] == stamp
+        ):
+            config = self._devcontainer_json_cache[1]
+        else:
+            try:
+                with devcontainer_json_path.open("rb") as f:
+                    config = json.load(f)
+            except json.JSONDecodeError:
+                return True
+            self._devcontainer_json_cache = (stamp, config)
 
         mounts = config.get("mounts", [])
         if not isinstance(mounts, list):
             return True
 
-        has_settings = any(".settings.runtime.json" in mount for mount in mounts)
-        has_mcp = any(".mcp.runtime.json" in mount for mount in mounts)
-        has_workspace_mcp = any("/workspace/.mcp.json" in mount for mount in mounts)
+        # One pass over the mount strings, extracting each target= value
+        # into a set - exact target matches instead of three substring
+        # scans (a dict-form mount has no "target=" key and is skipped)
+        targets = {
+            mount.split("target=", 1)[1].split(",", 1)[0]
+            for mount in mounts
+            if "target=" in mount
+        }
+        has_settings = "/home/claude/.claude/settings.json" in targets
+        has_mcp = "/home/claude/.claude/.mcp.json" in targets
+        has_workspace_mcp = "/workspace/.mcp.json" in targets
         runtime_settings = self.devcontainer_path / ".settings.runtime.json"
         runtime_mcp = self.devcontainer_path / ".mcp.runtime.json"
         has_runtime = (
@@ -207,14 +353,10 @@ class DevContainer:
         mcp_servers = config.get("mcp_servers", [])
         custom_mcp_servers = config.get("custom_mcp_servers", {})
 
-        # Reconstruct claude_context config if it exists
-        claude_context = None
-        if "claude_context" in config:
-            from csb.claude_context import ClaudeContextConfig
-
-            claude_context = ClaudeContextConfig.from_dict(config["claude_context"])
-
-        self._update_config_files(mcp_servers, custom_mcp_servers, claude_context)
+        # The stored claude_context dict passes through as-is
+        self._update_config_files(
+            mcp_servers, custom_mcp_servers, config.get("claude_context")
+        )
 
     def add_mcp_server(self, server_name: str) -> bool:
         """Add a built-in MCP server to the configuration.
@@ -232,15 +374,10 @@ class DevContainer:
 
         mcp_servers.append(server_name)
 
-        # Preserve claude_context
-        claude_context = None
-        if "claude_context" in config:
-            from csb.claude_context import ClaudeContextConfig
-
-            claude_context = ClaudeContextConfig.from_dict(config["claude_context"])
-
         self._update_config_files(
-            mcp_servers, config.get("custom_mcp_servers", {}), claude_context
+            mcp_servers,
+            config.get("custom_mcp_servers", {}),
+            config.get("claude_context"),
         )
         return True
 
@@ -266,14 +403,9 @@ class DevContainer:
             removed = True
 
         if removed:
-            # Preserve claude_context
-            claude_context = None
-            if "claude_context" in config:
-                from csb.claude_context import ClaudeContextConfig
-
-                claude_context = ClaudeContextConfig.from_dict(config["claude_context"])
-
-            self._update_config_files(mcp_servers, custom_mcp_servers, claude_context)
+            self._update_config_files(
+                mcp_servers, custom_mcp_servers, config.get("claude_context")
+            )
 
         return removed
 
@@ -301,15 +433,10 @@ class DevContainer:
             custom_mcp_servers[name]["env"] = env
             custom_mcp_servers[name]["required_env"] = list(env.keys())
 
-        # Preserve claude_context
-        claude_context = None
-        if "claude_context" in config:
-            from csb.claude_context import ClaudeContextConfig
-
-            claude_context = ClaudeContextConfig.from_dict(config["claude_context"])
-
         self._update_config_files(
-            config.get("mcp_servers", []), custom_mcp_servers, claude_context
+            config.get("mcp_servers", []),
+            custom_mcp_servers,
+            config.get("claude_context"),
         )
         return True
 
@@ -320,31 +447,23 @@ class DevContainer:
         has_context_setup: bool = False,
     ) -> dict:
         """Generate devcontainer.json configuration."""
-        # Collect required env vars from selected MCP servers
-        env_vars = {}
-        for server_name in mcp_servers:
-            server = MCP_SERVERS.get(server_name, {})
-            for env_var in server.get("required_env", []):
-                env_vars[env_var] = f"${{localEnv:{env_var}}}"
+        from csb.mcp import MCP_SERVER_ENV
+
+        # Collect required env vars from selected MCP servers - the
+        # flattened index replaces the nested registry-dict walk
+        env_vars = {
+            env_var: f"${{localEnv:{env_var}}}"
+            for server_name in mcp_servers
+            for env_var in MCP_SERVER_ENV.get(server_name, ())
+        }
 
         # Add env vars from custom MCP servers
         if custom_mcp_servers:
-            for server_config in custom_mcp_servers.values():
-                for env_var in server_config.get("required_env", []):
-                    env_vars[env_var] = f"${{localEnv:{env_var}}}"
-
-        # Build postCreateCommand - run context setup if it exists
-        post_create = (
-            "if [ -f /workspace/.devcontainer/claude-context/setup-claude-context.sh ]; then "
-            "/workspace/.devcontainer/claude-context/setup-claude-context.sh; fi"
-        )
-
-        # postStartCommand - re-run context setup on each start (in case sources changed)
-        post_start = (
-            "if [ -f /workspace/.devcontainer/claude-context/setup-claude-context.sh ]; then "
-            "/workspace/.devcontainer/claude-context/setup-claude-context.sh; "
-            "fi; echo 'Claude Sandbox ready! Run: claude --dangerously-skip-permissions'"
-        )
+            env_vars.update(
+                (env_var, f"${{localEnv:{env_var}}}")
+                for server_config in custom_mcp_servers.values()
+                for env_var in server_config.get("required_env", ())
+            )
 
         return {
             "name": "Claude Sandbox",
@@ -367,8 +486,8 @@ class DevContainer:
                 **env_vars,
             },
             "remoteUser": "claude",
-            "postCreateCommand": post_create,
-            "postStartCommand": post_start,
+            "postCreateCommand": _POST_CREATE_COMMAND,
+            "postStartCommand": _POST_START_COMMAND,
         }
 
     def up(self, rebuild: bool = False, no_cache: bool = False) -> CommandResult:
@@ -378,6 +497,7 @@ class DevContainer:
             rebuild: If True, removes existing container before starting
             no_cache: If True, forces a full image rebuild without Docker cache
         """
+        self._invalidate_container_id()
         cmd = [
             "devcontainer",
             "up",
@@ -433,13 +553,29 @@ class DevContainer:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,  # Line buffered
+                bufsize=0,
             )
 
-            output_lines = []
-            for line in process.stdout:
-                line = line.rstrip("\n")
+            # Read the pipe in 64 KiB chunks and split lines here -
+            # line-buffered text mode funnels every byte through a
+            # TextIOWrapper and makes one Python iteration per line.
+            # The retained log is bounded; a long no-cache build can
+            # emit far more than anyone reads back from CommandResult.
+            fd = process.stdout.fileno()
+            output_lines = deque(maxlen=2000)
+            pending = b""
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for raw in lines:
+                    line = raw.decode("utf-8", errors="replace")
+                    output_lines.append(line)
+                    yield line
+            if pending:
+                line = pending.decode("utf-8", errors="replace")
                 output_lines.append(line)
                 yield line
 
@@ -453,29 +589,65 @@ class DevContainer:
         except Exception as e:
             yield CommandResult(success=False, error=str(e))
 
-    def down(self) -> CommandResult:
-        """Stop the devcontainer."""
+    def _find_container_id(self, include_stopped: bool = False) -> str | None:
+        """Locate this project's container by its devcontainer label.
+
+        Asks the daemon over the UNIX socket first - a few ms against
+        the 100-200ms fork+exec of a `docker ps` - and falls back to
+        the CLI when the socket is unreachable (rootless setups, remote
+        contexts), same split as the cleanup module.
+        """
+        label = f"devcontainer.local_folder={self.project_path}"
         try:
-            # Find container ID using docker ps with devcontainer label
-            # Devcontainers are labeled with devcontainer.local_folder
-            workspace_path = str(self.project_path)
-            find_cmd = [
-                "docker",
-                "ps",
-                "-q",
-                "--filter",
-                f"label=devcontainer.local_folder={workspace_path}",
-            ]
+            import urllib.parse
+
+            from csb.docker_api import api_json
+
+            filters = urllib.parse.quote(json.dumps({"label": [label]}))
+            all_flag = 1 if include_stopped else 0
+            data = api_json(
+                "GET", f"/containers/json?all={all_flag}&filters={filters}"
+            )
+            if isinstance(data, list):
+                return data[0].get("Id") if data else None
+        except OSError:
+            pass
+
+        find_cmd = [
+            "docker",
+            "ps",
+            "-aq" if include_stopped else "-q",
+            "--filter",
+            f"label={label}",
+        ]
+        try:
+            # close_fds=False keeps the spawn on the posix_spawn fast
+            # path with no fd-close loop; a docker ps query can't
+            # misuse inherited descriptors
             result = subprocess.run(
-                find_cmd, capture_output=True, text=True, timeout=10
+                find_cmd,
+                capture_output=True,
+                text=True,
+                timeout=10,
+                close_fds=False,
             )
+        except Exception:
+            return None
+        container_id = result.stdout.strip()
+        return container_id or None
 
-            container_id = result.stdout.strip()
+    def down(self) -> CommandResult:
+        """Stop the devcontainer."""
+        self._invalidate_container_id()
+        try:
+            container_id = self._find_container_id()
             if not container_id:
                 return CommandResult(success=True, output="Container not running")
 
-            # Stop the container
-            stop_cmd = ["docker", "stop", container_id]
+            # Stop the container with a short SIGTERM grace - the
+            # default 10s mostly benefits servers draining traffic;
+            # a dev container has nothing to drain
+            stop_cmd = ["docker", "stop", "--time", "2", container_id]
             stop_result = subprocess.run(
                 stop_cmd, capture_output=True, text=True, timeout=30
             )
@@ -495,22 +667,10 @@ class DevContainer:
 
         Finds and removes the container associated with this project.
         """
+        self._invalidate_container_id()
         try:
-            workspace_path = str(self.project_path)
-
-            # Find container (including stopped ones) using -a flag
-            find_cmd = [
-                "docker",
-                "ps",
-                "-aq",
-                "--filter",
-                f"label=devcontainer.local_folder={workspace_path}",
-            ]
-            result = subprocess.run(
-                find_cmd, capture_output=True, text=True, timeout=10
-            )
-
-            container_id = result.stdout.strip()
+            # Find container (including stopped ones)
+            container_id = self._find_container_id(include_stopped=True)
             if not container_id:
                 return CommandResult(success=False, error="No container found")
 
@@ -549,7 +709,7 @@ class DevContainer:
                 f"reference=vsc-{folder_name}-*",
             ]
             result = subprocess.run(
-                find_cmd, capture_output=True, text=True, timeout=10
+                find_cmd, capture_output=True, text=True, timeout=10, close_fds=False
             )
 
             image_ids = result.stdout.strip().split("\n")
@@ -603,42 +763,48 @@ class DevContainer:
         os.execvp("devcontainer", cmd)
 
     def is_running(self) -> bool:
-        """Check if the container is running."""
-        cmd = [
-            "devcontainer",
-            "exec",
-            "--workspace-folder",
-            str(self.project_path),
-            "true",
-        ]
+        """Check if the container is running.
+
+        Inspects the container state directly rather than round-tripping
+        a `devcontainer exec ... true` through two process spawns; any
+        failure still reads as not running.
+        """
+        container_id = self.get_container_id()
+        if not container_id:
+            return False
+        try:
+            from csb.docker_api import api_json
+
+            data = api_json(
+                "GET", f"/containers/{container_id}/json", timeout=5
+            )
+            if data is not None:
+                return bool(data.get("State", {}).get("Running"))
+        except OSError:
+            pass
         try:
             result = subprocess.run(
-                cmd,
+                ["docker", "inspect", "-f", "{{.State.Running}}", container_id],
                 capture_output=True,
+                text=True,
                 timeout=5,
+                close_fds=False,
             )
-            return result.returncode == 0
+            return result.returncode == 0 and result.stdout.strip() == "true"
         except Exception:
             return False
 
     def get_container_id(self) -> str | None:
-        """Get the container ID for this project."""
-        workspace_path = str(self.project_path)
-        find_cmd = [
-            "docker",
-            "ps",
-            "-q",
-            "--filter",
-            f"label=devcontainer.local_folder={workspace_path}",
-        ]
-        try:
-            result = subprocess.run(
-                find_cmd, capture_output=True, text=True, timeout=10
-            )
-            container_id = result.stdout.strip()
-            return container_id if container_id else None
-        except Exception:
-            return None
+        """Get the container ID for this project.
+
+        The answer is memoized per instance - each lookup is a daemon
+        roundtrip - and invalidated by the lifecycle methods that can
+        change it (up/down/remove).
+        """
+        if self._container_id_cache is not self._ID_UNKNOWN:
+            return self._container_id_cache
+        self._container_id_cache = self._find_container_id()
+        return self._container_id_cache
 
     def logs(self, follow: bool = False, tail: int | None = None) -> None:
         """Show container logs.
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 # Registry of available MCP servers
@@ -42,6 +43,26 @@ MCP_SERVERS = {
     },
 }
 
+# Required env vars per built-in server, flattened once at import so
+# devcontainer.json generation doesn't re-walk the registry dicts
+MCP_SERVER_ENV: dict[str, tuple[str, ...]] = {
+    name: tuple(server["required_env"]) for name, server in MCP_SERVERS.items()
+}
+
+# The .mcp.json entry for each built-in server never varies between
+# calls, so build it once here; generate_mcp_config hands out shallow
+# copies (the nested args/env values were already shared before)
+_BUILTIN_CONFIGS: dict[str, dict] = {
+    name: {
+        "command": server["command"],
+        "args": server["args"],
+        "trusted": True,
+        "autoStart": True,
+        **({"env": server["env"]} if "env" in server else {}),
+    }
+    for name, server in MCP_SERVERS.items()
+}
+
 
 def generate_mcp_config(
     server_names: list[str], custom_servers: dict | None = None
@@ -52,58 +73,70 @@ def generate_mcp_config(
         server_names: List of built-in MCP server names to include
         custom_servers: Dict of custom server configs {name: {command, args, env, ...}}
     """
+    # Fresh dict rather than a shared sentinel - callers mutate the result
+    if not server_names and not custom_servers:
+        return {"mcpServers": {}}
+
     config = {"mcpServers": {}}
 
-    # Add built-in servers
+    # Add built-in servers - one dict copy per server from the
+    # precomputed entries
     for name in server_names:
-        if name not in MCP_SERVERS:
-            continue
-
-        server = MCP_SERVERS[name]
-        server_config = {
-            "command": server["command"],
-            "args": server["args"],
-            "trusted": True,
-            "autoStart": True,
-        }
-
-        if "env" in server:
-            server_config["env"] = server["env"]
-
-        config["mcpServers"][name] = server_config
+        builtin = _BUILTIN_CONFIGS.get(name)
+        if builtin is not None:
+            config["mcpServers"][name] = builtin.copy()
 
-    # Add custom servers
+    # Add custom servers - one dict literal per server, with the env
+    # key spliced in only when present
     if custom_servers:
         for name, server in custom_servers.items():
-            server_config = {
+            config["mcpServers"][name] = {
                 "command": server["command"],
                 "args": server.get("args", []),
                 "trusted": True,
                 "autoStart": True,
+                **({"env": server["env"]} if "env" in server else {}),
             }
-            if "env" in server:
-                server_config["env"] = server["env"]
-            config["mcpServers"][name] = server_config
 
     return config
 
 
+# Parsed configs keyed by path, stamped with the file's
+# (mtime_ns, size) - the usual stat-stamp scheme. The global
+# ~/.claude/.mcp.json rarely changes between the repeated
+# generate_runtime_mcp_config calls in one process, so unchanged files
+# cost one stat instead of a parse. Cached dicts are only ever merged
+# from, never mutated.
+_mcp_config_cache: dict[str, tuple[tuple[int, int], dict | None]] = {}
+
+
 def _load_mcp_config(path: Path) -> dict | None:
-    if not path.exists():
-        return None
     try:
-        return json.loads(path.read_text())
-    except json.JSONDecodeError:
+        st = os.stat(path)
+    except OSError:
         return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    entry = _mcp_config_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    # The C parser consumes the bytes without an intermediate str
+    try:
+        with path.open("rb") as f:
+            config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        config = None
+    _mcp_config_cache[key] = (stamp, config)
+    return config
 
 
 def _merge_mcp_configs(base: dict, override: dict) -> dict:
-    return {
-        "mcpServers": {
-            **base.get("mcpServers", {}),
-            **override.get("mcpServers", {}),
-        }
-    }
+    # One merged dict via C-level bulk update instead of ** unpacking
+    # (which allocates a default dict per missing key on top)
+    merged: dict = {}
+    merged.update(base.get("mcpServers") or ())
+    merged.update(override.get("mcpServers") or ())
+    return {"mcpServers": merged}
 
 
 def generate_runtime_mcp_config(
@@ -113,13 +146,20 @@ def generate_runtime_mcp_config(
     global_config_path: Path | None = None,
 ) -> dict:
     """Generate MCP config for container runtime."""
-    project_config = generate_mcp_config(server_names, custom_servers)
-
     if not merge_global:
-        return project_config
+        return generate_mcp_config(server_names, custom_servers)
 
     if global_config_path is None:
         global_config_path = Path.home() / ".claude" / ".mcp.json"
 
-    global_config = _load_mcp_config(global_config_path) or {"mcpServers": {}}
-    return _merge_mcp_configs(global_config, project_config)
+    global_config = _load_mcp_config(global_config_path)
+
+    # Merge-only case: the project adds nothing, so the result is just
+    # the global servers (copied - the cached parse must stay pristine)
+    if not server_names and not custom_servers:
+        servers = global_config.get("mcpServers") if global_config else None
+        return {"mcpServers": dict(servers or ())}
+
+    return _merge_mcp_configs(
+        global_config or {}, generate_mcp_config(server_names, custom_servers)
+    )